@@ -0,0 +1,18 @@
+"""
+Context-local state for the running voice session.
+
+The voice pipeline runs in its own thread and event loop. VoicePipelineRunner
+sets SESSION_ID_VAR before starting that loop, so every task spawned inside it
+can read the session ID without importing the runner.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+
+__all__ = ["SESSION_ID_VAR", "DEFAULT_SESSION_ID"]
+
+DEFAULT_SESSION_ID = "default"
+
+SESSION_ID_VAR: ContextVar[str] = ContextVar("voice_session_id", default=DEFAULT_SESSION_ID)
+"""Session ID of the voice pipeline owning the current context."""
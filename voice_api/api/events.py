@@ -15,7 +15,7 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from ..config import LOGGER
 
 
-@dataclass
+@dataclass(slots=True)
 class FormEvent:
     """
     Event structure for form state changes.
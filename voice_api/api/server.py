@@ -429,7 +429,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                             "examples": f.examples,
                             "required": f.required,
                             "validator_type": f.validator.type,
-                            "enum_values": f.enum_values,
+                            "enum_values": dict(f.enum_values) if f.enum_values else None,
                         }
                         for f in ANMELDUNG_FORM_FIELDS
                     ],
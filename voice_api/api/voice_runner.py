@@ -13,6 +13,7 @@ from typing import Optional
 
 from ..client import run as run_voice_client
 from ..config import LOGGER
+from .context import SESSION_ID_VAR
 
 
 class VoicePipelineRunner:
@@ -47,6 +48,8 @@ class VoicePipelineRunner:
         self._current_session_id = session_id
         
         def run_in_thread():
+            # Set before asyncio.run so the pipeline's tasks inherit the session ID
+            SESSION_ID_VAR.set(session_id)
             try:
                 asyncio.run(run_voice_client())
             except KeyboardInterrupt:
@@ -14,7 +14,7 @@ modules to create a complete voice form experience.
 from .audio import AudioPipelines
 from .session import listen_to_microphone, play_audio, receive_from_model, send_realtime_audio
 from .state import FormState
-from .validation import ValidationResult, get_enum_display, validate_field
+from .validation import ValidationResult, get_enum_display, validate_all, validate_field
 
 __all__ = [
     # State
@@ -28,6 +28,7 @@ __all__ = [
     "play_audio",
     # Validation
     "validate_field",
+    "validate_all",
     "get_enum_display",
     "ValidationResult",
 ]
@@ -17,10 +17,15 @@ from typing import Optional
 
 import pyaudio
 
-from ..config import LOGGER, AudioConfig, default_audio_config
+from ..config import LOGGER, PA_INT16, AudioConfig, default_audio_config
 
+if pyaudio.paInt16 != PA_INT16:
+    raise RuntimeError(
+        f"PA_INT16 ({PA_INT16}) does not match pyaudio.paInt16 ({pyaudio.paInt16})"
+    )
 
-@dataclass
+
+@dataclass(slots=True)
 class AudioPipelines:
     """
     Wrap PyAudio input/output streams and async queues.
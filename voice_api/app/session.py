@@ -26,6 +26,9 @@ __all__ = [
     "play_audio",
 ]
 
+# Log sent-chunk progress every 64 chunks (power of two so the check is a mask)
+_LOG_MASK = 63
+
 
 async def listen_to_microphone(audio: AudioPipelines, stop_event: asyncio.Event) -> None:
     """
@@ -44,13 +47,15 @@ async def listen_to_microphone(audio: AudioPipelines, stop_event: asyncio.Event)
     """
     await audio.open_mic()
     kwargs = {"exception_on_overflow": False}
+    # Resolve per-frame callables once rather than on every loop iteration
+    read = audio.mic_stream.read  # type: ignore[union-attr]
+    put = audio.mic_queue.put_nowait
+    chunk_size = audio.config.chunk_size
     try:
         while not stop_event.is_set():
-            data = await asyncio.to_thread(
-                audio.mic_stream.read, audio.config.chunk_size, **kwargs  # type: ignore[arg-type]
-            )
+            data = await asyncio.to_thread(read, chunk_size, **kwargs)
             try:
-                audio.mic_queue.put_nowait({"data": data, "mime_type": "audio/pcm"})
+                put({"data": data, "mime_type": "audio/pcm"})
             except asyncio.QueueFull:
                 LOGGER.debug("Microphone queue full; dropping audio chunk")
     except Exception as exc:  # noqa: BLE001
@@ -79,18 +84,22 @@ async def send_realtime_audio(
     Logs:
         - Suppressed chunks (during playback)
         - Send failures (stops loop on error)
-        - Send count (every 50 chunks)
+        - Send count (every 64 chunks)
     """
     send_count = 0
+    # Resolve per-chunk callables once rather than on every loop iteration
+    send = session.send_realtime_input
+    get = audio.mic_queue.get
+    is_playing = play_guard.is_set
     while not stop_event.is_set():
-        msg = await audio.mic_queue.get()
-        if play_guard.is_set():
+        msg = await get()
+        if is_playing():
             LOGGER.debug("Dropping mic chunk while playback is active")
             continue
         try:
-            await session.send_realtime_input(audio=msg)
+            await send(audio=msg)
             send_count += 1
-            if send_count % 50 == 0:
+            if not (send_count & _LOG_MASK):
                 LOGGER.info("Sent %s audio chunks", send_count)
         except Exception as exc:  # noqa: BLE001
             LOGGER.error("Failed to send audio chunk: %s", exc)
@@ -115,14 +124,18 @@ async def play_audio(
         - Playback errors (stops loop on error)
     """
     await audio.open_speaker()
+    # Resolve per-chunk callables once rather than on every loop iteration
+    write = audio.speaker_stream.write  # type: ignore[union-attr]
+    get = audio.playback_queue.get
+    queue_empty = audio.playback_queue.empty
     try:
         while not stop_event.is_set():
-            bytestream = await audio.playback_queue.get()
+            bytestream = await get()
             play_guard.set()
             try:
-                await asyncio.to_thread(audio.speaker_stream.write, bytestream)  # type: ignore[arg-type]
+                await asyncio.to_thread(write, bytestream)
             finally:
-                if audio.playback_queue.empty():
+                if queue_empty():
                     play_guard.clear()
     except Exception as exc:  # noqa: BLE001
         LOGGER.error("Playback loop error: %s", exc)
@@ -161,11 +174,11 @@ async def receive_from_model(
     """
     # Import here to avoid circular dependency between app and llm modules
     from ..llm import handle_tool_calls
+    from ..api.context import SESSION_ID_VAR
     from ..api.events import FormEvent, event_emitter
-    from ..api.voice_runner import voice_runner
     
-    # Get current session ID
-    session_id = voice_runner.get_current_session_id() or "default"
+    # Get current session ID (set by VoicePipelineRunner for this thread)
+    session_id = SESSION_ID_VAR.get()
     
     response_count = 0
     while not stop_event.is_set():
@@ -187,6 +200,11 @@ async def receive_from_model(
                 if not server_content:
                     continue
 
+                # Read the optional sub-messages once; most responses set only one
+                model_turn = server_content.model_turn
+                input_transcription = server_content.input_transcription
+                output_transcription = server_content.output_transcription
+
                 # Handle interrupts (clear playback queue)
                 if server_content.interrupted:
                     LOGGER.info("Model interrupted current turn; clearing playback queue")
@@ -195,23 +213,27 @@ async def receive_from_model(
                         audio.playback_queue.get_nowait()
 
                 # Handle model turn (thoughts, text, and audio)
-                if server_content.model_turn:
-                    parts = server_content.model_turn.parts or []
+                if model_turn:
+                    parts = model_turn.parts or []
                     LOGGER.debug("Model turn with %s part(s)", len(parts))
+                    audio_chunks = []
                     for part in parts:
                         if part.thought:
                             LOGGER.debug("Model thought: %s", part.thought)
                         if part.text:
                             LOGGER.info("Model text: %s", part.text)
                         if part.inline_data and isinstance(part.inline_data.data, bytes):
-                            audio.playback_queue.put_nowait(part.inline_data.data)
+                            audio_chunks.append(part.inline_data.data)
+                    # Enqueue the turn's audio as one chunk: one queue transaction
+                    # and one speaker write instead of one per part
+                    if audio_chunks:
+                        audio.playback_queue.put_nowait(
+                            audio_chunks[0] if len(audio_chunks) == 1 else b"".join(audio_chunks)
+                        )
 
                 # Log input transcription (what user said)
-                if (
-                    server_content.input_transcription
-                    and server_content.input_transcription.text
-                ):
-                    user_text = server_content.input_transcription.text
+                if input_transcription and input_transcription.text:
+                    user_text = input_transcription.text
                     LOGGER.info("User said: %s", user_text)
                     
                     # Emit transcript event
@@ -227,11 +249,8 @@ async def receive_from_model(
                     )
 
                 # Log output transcription (what model said)
-                if (
-                    server_content.output_transcription
-                    and server_content.output_transcription.text
-                ):
-                    model_text = server_content.output_transcription.text
+                if output_transcription and output_transcription.text:
+                    model_text = output_transcription.text
                     LOGGER.info("Model (voice): %s", model_text)
                     
                     # Emit transcript event
@@ -13,13 +13,34 @@ tool handling) to maintain a consistent view of the form's state.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from ..core import ANMELDUNG_FORM_FIELDS, AnmeldungField, transform_answers_to_pdf_format
+from ..core import (
+    ANMELDUNG_FORM_FIELDS,
+    FIELD_BY_ID,
+    AnmeldungField,
+    transform_answers_to_pdf_format,
+)
 
 
-@dataclass
+def _build_index(fields: Sequence[AnmeldungField]) -> Dict[str, int]:
+    """Map each field_id to its position, keeping the first occurrence."""
+    index: Dict[str, int] = {}
+    for idx, form_field in enumerate(fields):
+        index.setdefault(form_field.field_id, idx)
+    return index
+
+
+# Position lookup for the default catalog, shared like the catalog itself
+_DEFAULT_INDEX = _build_index(ANMELDUNG_FORM_FIELDS)
+
+FormSnapshot = Tuple[int, Dict[str, str], Dict[str, str]]
+"""Mutable part of a FormState: (current_index, answers, validation_errors)."""
+
+
+@dataclass(slots=True)
 class FormState:
     """
     Tracks the user's progress through the form.
@@ -29,16 +50,28 @@ class FormState:
     record values, and convert to PDF format for document generation.
 
     Attributes:
-        fields: List of all form fields to collect (ordered)
+        fields: Ordered, read-only sequence of form fields to collect (shared by default)
         current_index: Index of the current field being filled
         answers: Dictionary of field_id → user answer
         validation_errors: Dictionary of field_id → error message
     """
 
-    fields: List[AnmeldungField] = field(default_factory=lambda: ANMELDUNG_FORM_FIELDS.copy())
+    # The field catalog is an immutable tuple, so every FormState shares it
+    fields: Sequence[AnmeldungField] = ANMELDUNG_FORM_FIELDS
     current_index: int = 0
     answers: Dict[str, str] = field(default_factory=dict)
     validation_errors: Dict[str, str] = field(default_factory=dict)
+    _total: int = field(init=False, repr=False, compare=False)
+    _index_by_id: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # fields never change after construction, so its length and
+        # field_id → position map are computed once
+        self._total = len(self.fields)
+        if self.fields is ANMELDUNG_FORM_FIELDS:
+            self._index_by_id = _DEFAULT_INDEX
+        else:
+            self._index_by_id = _build_index(self.fields)
 
     def current_field(self) -> Optional[AnmeldungField]:
         """
@@ -47,7 +80,7 @@ class FormState:
         Returns:
             The AnmeldungField at current_index, or None if we've passed the end
         """
-        if self.current_index < len(self.fields):
+        if self.current_index < self._total:
             return self.fields[self.current_index]
         return None
 
@@ -73,11 +106,23 @@ class FormState:
         Returns:
             The AnmeldungField if found, or None if field_id doesn't exist
         """
-        for idx, field in enumerate(self.fields):
-            if field.field_id == field_id:
-                self.current_index = idx
-                return field
-        return None
+        idx = self._index_by_id.get(field_id)
+        if idx is None:
+            return None
+        self.current_index = idx
+        return self.fields[idx]
+
+    def index_of(self, field_id: str) -> Optional[int]:
+        """
+        Return the position of a field in the form, or None if unknown.
+
+        Args:
+            field_id: The unique identifier of the field
+
+        Returns:
+            Zero-based index into fields, or None if field_id isn't part of the form
+        """
+        return self._index_by_id.get(field_id)
 
     def is_complete(self) -> bool:
         """
@@ -86,7 +131,7 @@ class FormState:
         Returns:
             True if current_index >= len(fields)
         """
-        return self.current_index >= len(self.fields)
+        return self.current_index >= self._total
 
     def record_value(self, field_id: str, value: str) -> None:
         """
@@ -96,9 +141,37 @@ class FormState:
             field_id: The field's unique identifier
             value: The validated value to store
         """
+        # Model-supplied ids arrive as fresh strings; intern them like the catalog keys
+        field_id = sys.intern(field_id)
         self.answers[field_id] = value
         self.validation_errors.pop(field_id, None)
 
+    def saved_fields(self) -> List[Dict[str, Any]]:
+        """
+        List the saved answers with their field metadata, in save order.
+
+        Answers whose field_id is not a known field are skipped.
+
+        Returns:
+            One dict per answer with field_id, label, value and field_index
+            (-1 if the field is known but not part of this form)
+        """
+        index_by_id = self._index_by_id
+        saved = []
+        for field_id, value in self.answers.items():
+            form_field = FIELD_BY_ID.get(field_id)
+            if form_field is None:
+                continue
+            saved.append(
+                {
+                    "field_id": field_id,
+                    "label": form_field.label,
+                    "value": value,
+                    "field_index": index_by_id.get(field_id, -1),
+                }
+            )
+        return saved
+
     def set_error(self, field_id: str, message: str) -> None:
         """
         Remember a validation error for a field.
@@ -116,11 +189,37 @@ class FormState:
         Returns:
             Percentage of fields that have been answered
         """
-        total = len(self.fields)
+        total = self._total
         if total == 0:
             return 100.0
         return min(100.0, (len(self.answers) / total) * 100)
 
+    def snapshot(self) -> FormSnapshot:
+        """
+        Capture the mutable progress of the form.
+
+        The field catalog is immutable and shared, so only the position,
+        answers and errors are copied.
+
+        Returns:
+            A (current_index, answers, validation_errors) tuple for restore()
+        """
+        return self.current_index, dict(self.answers), dict(self.validation_errors)
+
+    def restore(self, snapshot: FormSnapshot) -> None:
+        """
+        Reset progress to a previously captured snapshot.
+
+        The snapshot is copied, so it can be restored more than once.
+
+        Args:
+            snapshot: Tuple returned by snapshot()
+        """
+        current_index, answers, validation_errors = snapshot
+        self.current_index = current_index
+        self.answers = dict(answers)
+        self.validation_errors = dict(validation_errors)
+
     def to_pdf_format(self) -> Dict[str, Any]:
         """
         Convert collected answers to PDF field format.
@@ -11,10 +11,12 @@ keeping the core module independent and the app logic clean.
 
 from __future__ import annotations
 
-from ..core import ValidationResult, validate_by_type
+from typing import Dict, Iterable, Mapping
+
+from ..core import ValidationResult, validate_by_type, validate_integer_choice
 from ..core.fields import AnmeldungField
 
-__all__ = ["validate_field", "get_enum_display", "ValidationResult"]
+__all__ = ["validate_field", "validate_all", "get_enum_display", "ValidationResult"]
 
 
 def validate_field(field: AnmeldungField, value: str) -> ValidationResult:
@@ -39,19 +41,54 @@ def validate_field(field: AnmeldungField, value: str) -> ValidationResult:
         >>> validate_field(field, "")
         (False, "... is required")
     """
-    # Check required fields
-    if field.required and (not value or not value.strip()):
-        return False, f"{field.label} is required."
-
-    # Empty value on optional field is OK
-    if not value or not value.strip():
+    # Blank means empty or whitespace-only; isspace() scans without copying
+    if not value or value.isspace():
+        # Check required fields; an empty value on an optional field is OK
+        if field.required:
+            return False, f"{field.label} is required."
         return True, ""
 
     # Dispatch to validator based on field type
-    validator_type = field.validator.type
-    validator_config = field.validator.config or {}
+    validator = field.validator
+    if validator.type == "integer_choice":
+        # Canonical answers ("0", "1", ...) are accepted by set membership
+        if value in validator.choice_strings:
+            return True, ""
+        # Bounds are pre-extracted on the validator; skip the config dict lookups
+        return validate_integer_choice(value, validator.min_value, validator.max_value)
+
+    return validate_by_type(validator.type, value, validator.config)
+
 
-    return validate_by_type(validator_type, value, validator_config)
+def validate_all(
+    fields: Iterable[AnmeldungField], answers: Mapping[str, str]
+) -> Dict[str, str]:
+    """
+    Validate a whole form's answers in one pass.
+
+    Intended as an end-of-form check (e.g. before PDF generation). Each field is
+    validated against its answer, so missing required answers are reported too.
+
+    Args:
+        fields: Form fields to check, in order (e.g. form_state.fields)
+        answers: Collected answers keyed by field_id
+
+    Returns:
+        Dictionary of field_id → error message for every invalid field (empty if all valid)
+
+    Examples:
+        >>> from voice_api.core import ANMELDUNG_FORM_FIELDS
+        >>> errors = validate_all(ANMELDUNG_FORM_FIELDS, {"family_name_p1": "Mueller"})
+        >>> "family_name_p1" in errors, "first_name_p1" in errors
+        (False, True)
+    """
+    errors: Dict[str, str] = {}
+    get_answer = answers.get
+    for field in fields:
+        is_valid, message = validate_field(field, get_answer(field.field_id, ""))
+        if not is_valid:
+            errors[field.field_id] = message
+    return errors
 
 
 def get_enum_display(field: AnmeldungField, value: str) -> str:
@@ -69,8 +106,8 @@ def get_enum_display(field: AnmeldungField, value: str) -> str:
         Human-readable display string, or the original value if not found
 
     Examples:
-        >>> from voice_api.core import ANMELDUNG_FORM_FIELDS
-        >>> gender_field = [f for f in ANMELDUNG_FORM_FIELDS if f.field_id == "gender_p1"][0]
+        >>> from voice_api.core import FIELD_BY_ID
+        >>> gender_field = FIELD_BY_ID["gender_p1"]
         >>> get_enum_display(gender_field, "0")
         'M (Male / Männlich)'
         >>> get_enum_display(gender_field, "1")
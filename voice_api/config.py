@@ -6,7 +6,7 @@ Configuration includes:
 - Model selection and parameters
 - Audio capture/playback settings
 
-Settings can be controlled via environment variables:
+Settings can be controlled via environment variables (or a .env file):
 - APP_LOG_LEVEL: Logging level (default: INFO)
 - APP_MODEL_NAME: Gemini model name (default: gemini-2.5-flash-native-audio-preview-09-2025)
 
@@ -17,35 +17,94 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Final, NamedTuple
 
-load_dotenv()
+# ---------------------------------------------------------------------------
+# Environment
+# ---------------------------------------------------------------------------
+_ENV_LOADED_FLAG = "APP_ENV_LOADED"
+
+
+def _bootstrap_env() -> None:
+    """
+    Load a .env file into the process environment once.
+
+    The dotenv import and .env file search are skipped when a previous import
+    (or a parent process) has already done it, as recorded by APP_ENV_LOADED.
+    python-dotenv is optional; without it only the real environment is used.
+    """
+    if os.environ.get(_ENV_LOADED_FLAG) == "1":
+        return
+    try:
+        from dotenv import load_dotenv  # Lazy import to keep module load lightweight
+    except ImportError:
+        return
+    load_dotenv()
+    os.environ[_ENV_LOADED_FLAG] = "1"
+
+
+_bootstrap_env()
 
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
-LOG_LEVEL = os.getenv("APP_LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=LOG_LEVEL,
-    format="[%(levelname)s] %(name)s - %(message)s",
-)
+
+
+_LOG_LEVELS = {
+    "critical": logging.CRITICAL,
+    "fatal": logging.FATAL,
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "warn": logging.WARN,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+    "notset": logging.NOTSET,
+}
+
+
+@lru_cache(maxsize=1)
+def get_log_level() -> int:
+    """Return the configured log level (APP_LOG_LEVEL, default INFO; unknown names fall back to INFO)."""
+    return _LOG_LEVELS.get(os.getenv("APP_LOG_LEVEL", "info").lower(), logging.INFO)
+
+
+LOG_LEVEL: Final[int] = get_log_level()
+# Only configure the root logger once; re-imports must not stack handlers
+_root_logger = logging.getLogger()
+if not _root_logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(
+        logging.Formatter("[{levelname}] {name} - {message}", style="{", validate=False)
+    )
+    _root_logger.addHandler(_handler)
+    _root_logger.setLevel(LOG_LEVEL)
 LOGGER = logging.getLogger("voice_api")
 
 # ---------------------------------------------------------------------------
 # Model configuration
 # ---------------------------------------------------------------------------
-MODEL_NAME = os.getenv("APP_MODEL_NAME", "gemini-2.5-flash-native-audio-preview-09-2025")
+_DEFAULT_MODEL_NAME = "gemini-2.5-flash-native-audio-preview-09-2025"
+
+
+@lru_cache(maxsize=1)
+def get_model_name() -> str:
+    """Return the configured Gemini model name (APP_MODEL_NAME)."""
+    return os.getenv("APP_MODEL_NAME", _DEFAULT_MODEL_NAME)
+
+
+MODEL_NAME = get_model_name()
 
 # ---------------------------------------------------------------------------
 # Audio configuration
 # ---------------------------------------------------------------------------
+PA_INT16 = 8
+"""PortAudio sample format code for 16-bit PCM (same value as pyaudio.paInt16)."""
 
 
-@dataclass(frozen=True)
-class AudioConfig:
+class AudioConfig(NamedTuple):
     """
-    Audio parameters for both capture and playback.
+    Audio parameters for both capture and playback (immutable).
 
     Attributes:
         format: PyAudio format code (paInt16 for 16-bit PCM)
@@ -64,6 +123,7 @@ class AudioConfig:
     mic_queue_maxsize: int = 5
 
 
+@lru_cache(maxsize=1)
 def default_audio_config() -> AudioConfig:
     """
     Return default audio configuration for Gemini Live.
@@ -74,16 +134,14 @@ def default_audio_config() -> AudioConfig:
     - 24000 Hz for speaker (Gemini Live output rate)
     - 1024-byte chunks (standard frame size)
 
+    The config is immutable, so a single cached instance is shared. PyAudio is
+    not imported here; the format code is the PA_INT16 constant.
+
     Returns:
         AudioConfig with sensible defaults
-
-    Raises:
-        ImportError: If PyAudio cannot be imported
     """
-    import pyaudio  # Lazy import to keep module load lightweight
-
     return AudioConfig(
-        format=pyaudio.paInt16,
+        format=PA_INT16,
         channels=1,
         send_sample_rate=16000,
         receive_sample_rate=24000,
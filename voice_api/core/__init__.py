@@ -8,8 +8,16 @@ This module contains the fundamental building blocks for form processing:
 
 The core module is independent and can be used standalone for form validation
 and PDF generation without requiring the LLM or app modules.
+
+PDF helpers are resolved lazily (PEP 562) so that importing field definitions
+or validators does not load the PDF generation module.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .fields import (
     ANMELDUNG_FORM_FIELDS,
     AnmeldungField,
@@ -17,8 +25,20 @@ from .fields import (
     FIELD_BY_PDF_ID,
     FieldValidator,
 )
-from .pdf_generator import generate_anmeldung_pdf, transform_answers_to_pdf_format
-from .validators import ValidationResult, validate_by_type
+from .validators import (
+    ValidationResult,
+    validate_by_type,
+    validate_integer_choice,
+)
+
+if TYPE_CHECKING:
+    from .pdf_generator import generate_anmeldung_pdf, transform_answers_to_pdf_format
+
+# Lazily imported attribute -> submodule
+_LAZY = {
+    "generate_anmeldung_pdf": ".pdf_generator",
+    "transform_answers_to_pdf_format": ".pdf_generator",
+}
 
 __all__ = [
     # Fields
@@ -29,8 +49,23 @@ __all__ = [
     "FIELD_BY_PDF_ID",
     # Validators
     "validate_by_type",
+    "validate_integer_choice",
     "ValidationResult",
     # PDF
     "generate_anmeldung_pdf",
     "transform_answers_to_pdf_format",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported attributes on first access and cache them."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported attributes in dir()."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -19,43 +19,106 @@ Field definitions include:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
 
 
-@dataclass
+class _FrozenDict(Dict[Any, Any]):
+    """
+    Read-only dict for shared field metadata.
+
+    Used instead of MappingProxyType so definitions stay picklable; copies
+    return the same object since the contents never change.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        """Reject any mutation."""
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle as a rebuild from a plain dict."""
+        return (type(self), (dict(self),))
+
+    def __copy__(self) -> "_FrozenDict":
+        """Immutable, so a copy is the same object."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_FrozenDict":
+        """Immutable, so a deep copy is the same object."""
+        return self
+
+
+@dataclass(frozen=True, slots=True)
 class FieldValidator:
     """
     Configuration for field validation.
 
+    Validators are immutable; the integer_choice bounds are extracted from
+    config once at construction so validation does not re-read the dict.
+
     Attributes:
         type: Validator type ("text", "date_de", "integer_choice", "postal_code_de")
-        config: Validator-specific configuration (e.g., min/max for choices)
+        config: Validator-specific configuration (e.g., min/max for choices), read-only
+        min_value: Cached config["min"] (default 0)
+        max_value: Cached config["max"] (None for no maximum)
+        choice_strings: Canonical strings ("0", "1", ...) of every value in [min, max]
+            for integer_choice validators; empty otherwise or when there is no maximum
     """
 
     type: str
-    config: Optional[Dict[str, Any]] = None
+    config: Optional[Mapping[str, Any]] = None
+    min_value: int = field(init=False, repr=False, compare=False)
+    max_value: Optional[int] = field(init=False, repr=False, compare=False)
+    choice_strings: FrozenSet[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Ensure config is always a dict."""
-        if self.config is None:
-            self.config = {}
-
-
-@dataclass
+        """Intern the type, freeze config and cache the choice bounds and strings."""
+        # Interned type strings compare by identity against the dispatch table keys
+        object.__setattr__(self, "type", sys.intern(self.type))
+        config = _FrozenDict(self.config or {})
+        object.__setattr__(self, "config", config)
+        object.__setattr__(self, "min_value", config.get("min", 0))
+        object.__setattr__(self, "max_value", config.get("max"))
+        # Lets the common "0".."N" answers skip int() parsing entirely
+        max_value = self.max_value
+        choices = (
+            frozenset(str(i) for i in range(self.min_value, max_value + 1))
+            if self.type == "integer_choice" and max_value is not None
+            else frozenset()
+        )
+        object.__setattr__(self, "choice_strings", choices)
+
+    def __copy__(self) -> "FieldValidator":
+        """Immutable, so a copy is the same object."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FieldValidator":
+        """Immutable, so a deep copy is the same object."""
+        return self
+
+
+@dataclass(frozen=True, slots=True)
 class AnmeldungField:
     """
     Definition of a form field in the Anmeldung process.
 
+    Field definitions are immutable and slotted (no per-instance __dict__).
+
     Attributes:
         field_id: Unique voice-friendly identifier for internal use
         pdf_field_id: PDF form field name for document generation
         label: Short label for user-facing displays
         description: Detailed explanation of the field
         validator: FieldValidator specifying how to validate input
-        examples: List of valid example inputs
+        examples: Tuple of valid example inputs (interned, read-only)
         required: Whether field is mandatory (default: True)
-        enum_values: Optional dict mapping choice indices to display strings
+        enum_values: Optional read-only mapping of choice indices to display strings
     """
 
     field_id: str
@@ -63,10 +126,72 @@ class AnmeldungField:
     label: str
     description: str
     validator: FieldValidator
-    examples: List[str]
+    examples: Tuple[str, ...]
     required: bool = True
-    enum_values: Optional[Dict[int, str]] = None
+    enum_values: Optional[Mapping[int, str]] = None
+
+    def __post_init__(self) -> None:
+        """Intern identifiers and examples and freeze examples into a tuple."""
+        object.__setattr__(self, "field_id", sys.intern(self.field_id))
+        object.__setattr__(self, "pdf_field_id", sys.intern(self.pdf_field_id))
+        if self.examples is not None:
+            object.__setattr__(self, "examples", tuple(sys.intern(e) for e in self.examples))
+
+    def __copy__(self) -> "AnmeldungField":
+        """Immutable, so a copy is the same object."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "AnmeldungField":
+        """Immutable, so a deep copy is the same object."""
+        return self
+
+
+# ============================================================================
+# CHOICE OPTIONS (shared, read-only)
+# ============================================================================
+
+_GENDER_ENUM: Mapping[int, str] = _FrozenDict(
+    {
+        0: "M (Male / Männlich)",
+        1: "W (Female / Weiblich)",
+        2: "o.A. (No answer / ohne Angabe)",
+        3: "D (Diverse)",
+    }
+)
+
+_FAMILY_STATUS_ENUM: Mapping[int, str] = _FrozenDict(
+    {
+        0: "LD (Single / ledig)",
+        1: "VH (Married / verheiratet)",
+        2: "VW (Widowed / verwitwet)",
+        3: "GS (Divorced / geschieden)",
+        4: "LP (Registered partnership / Lebenspartnerschaft)",
+        5: "LV (Partner deceased / Lebenspartner verstorben)",
+        6: "LA (Partnership dissolved / Lebenspartnerschaft aufgehoben)",
+        7: "EA (Marriage annulled / Ehe aufgehoben)",
+        8: "LE (Partner declared dead / Lebenspartner für tot erklärt)",
+        9: "NB (Unknown / nicht bekannt)",
+    }
+)
+
+_RELIGION_ENUM: Mapping[int, str] = _FrozenDict(
+    {
+        0: "rk (Roman Catholic / Römisch-katholisch)",
+        1: "ak (Old Catholic / Altkatholisch)",
+        8: "ev (Protestant / Evangelisch)",
+        9: "lt (Lutheran / Evangelisch-lutherisch)",
+        21: "oa (None / keiner öffentlich-rechtlichen Religionsgesellschaft angehörig)",
+        22: "other (Other / Sonstiges)",
+    }
+)
 
+_HOUSING_TYPE_ENUM: Mapping[int, str] = _FrozenDict(
+    {
+        0: "alleinige Wohnung (Sole residence)",
+        1: "Hauptwohnung (Main residence)",
+        2: "Nebenwohnung (Secondary residence)",
+    }
+)
 
 # ============================================================================
 # PERSON 1 FIELDS (Required demographics and identification)
@@ -127,12 +252,7 @@ GENDER_P1 = AnmeldungField(
     description="Your gender (choose one: 0=Male, 1=Female, 2=No answer, 3=Diverse)",
     validator=FieldValidator(type="integer_choice", config={"min": 0, "max": 3}),
     examples=["0", "1", "3"],
-    enum_values={
-        0: "M (Male / Männlich)",
-        1: "W (Female / Weiblich)",
-        2: "o.A. (No answer / ohne Angabe)",
-        3: "D (Diverse)",
-    },
+    enum_values=_GENDER_ENUM,
 )
 
 FAMILY_STATUS_P1 = AnmeldungField(
@@ -147,18 +267,7 @@ FAMILY_STATUS_P1 = AnmeldungField(
     ),
     validator=FieldValidator(type="integer_choice", config={"min": 0, "max": 9}),
     examples=["0", "1"],
-    enum_values={
-        0: "LD (Single / ledig)",
-        1: "VH (Married / verheiratet)",
-        2: "VW (Widowed / verwitwet)",
-        3: "GS (Divorced / geschieden)",
-        4: "LP (Registered partnership / Lebenspartnerschaft)",
-        5: "LV (Partner deceased / Lebenspartner verstorben)",
-        6: "LA (Partnership dissolved / Lebenspartnerschaft aufgehoben)",
-        7: "EA (Marriage annulled / Ehe aufgehoben)",
-        8: "LE (Partner declared dead / Lebenspartner für tot erklärt)",
-        9: "NB (Unknown / nicht bekannt)",
-    },
+    enum_values=_FAMILY_STATUS_ENUM,
 )
 
 NATIONALITY_P1 = AnmeldungField(
@@ -184,14 +293,7 @@ RELIGION_P1 = AnmeldungField(
     ),
     validator=FieldValidator(type="integer_choice", config={"min": 0, "max": 22}),
     examples=["0", "8", "21"],
-    enum_values={
-        0: "rk (Roman Catholic / Römisch-katholisch)",
-        1: "ak (Old Catholic / Altkatholisch)",
-        8: "ev (Protestant / Evangelisch)",
-        9: "lt (Lutheran / Evangelisch-lutherisch)",
-        21: "oa (None / keiner öffentlich-rechtlichen Religionsgesellschaft angehörig)",
-        22: "other (Other / Sonstiges)",
-    },
+    enum_values=_RELIGION_ENUM,
 )
 
 # ============================================================================
@@ -254,18 +356,14 @@ HOUSING_TYPE = AnmeldungField(
     ),
     validator=FieldValidator(type="integer_choice", config={"min": 0, "max": 2}),
     examples=["0", "1"],
-    enum_values={
-        0: "alleinige Wohnung (Sole residence)",
-        1: "Hauptwohnung (Main residence)",
-        2: "Nebenwohnung (Secondary residence)",
-    },
+    enum_values=_HOUSING_TYPE_ENUM,
 )
 
 # ============================================================================
 # COMPLETE FORM FIELDS LIST & LOOKUP MAPS
 # ============================================================================
 
-ANMELDUNG_FORM_FIELDS: List[AnmeldungField] = [
+ANMELDUNG_FORM_FIELDS: Tuple[AnmeldungField, ...] = (
     # Person 1 details (demographics and identification)
     FAMILY_NAME_P1,
     FIRST_NAME_P1,
@@ -281,21 +379,24 @@ ANMELDUNG_FORM_FIELDS: List[AnmeldungField] = [
     NEW_POSTAL_CODE,
     NEW_CITY,
     HOUSING_TYPE,
-]
+)
 """
-Complete, ordered list of all form fields for the Anmeldung process.
+Complete, ordered tuple of all form fields for the Anmeldung process.
 
 Fields are presented in this order during the guided form flow.
 This is the source of truth for all field definitions.
 """
 
-# Fast lookup maps for field access
-FIELD_BY_ID: Dict[str, AnmeldungField] = {
-    field.field_id: field for field in ANMELDUNG_FORM_FIELDS
-}
+# Fast lookup maps for field access, built in a single pass and exposed read-only
+_by_id: Dict[str, AnmeldungField] = {}
+_by_pdf_id: Dict[str, AnmeldungField] = {}
+for _field in ANMELDUNG_FORM_FIELDS:
+    _by_id[_field.field_id] = _field
+    _by_pdf_id[_field.pdf_field_id] = _field
+del _field
+
+FIELD_BY_ID: Mapping[str, AnmeldungField] = _FrozenDict(_by_id)
 """Map voice field_id to AnmeldungField definition."""
 
-FIELD_BY_PDF_ID: Dict[str, AnmeldungField] = {
-    field.pdf_field_id: field for field in ANMELDUNG_FORM_FIELDS
-}
+FIELD_BY_PDF_ID: Mapping[str, AnmeldungField] = _FrozenDict(_by_pdf_id)
 """Map PDF field_id to AnmeldungField definition."""
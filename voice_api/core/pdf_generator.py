@@ -15,15 +15,91 @@ The module:
 from __future__ import annotations
 
 import os
-from io import BytesIO
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from .fields import FIELD_BY_ID
 
+# PyPDFForm's PdfWrapper, imported on the first fill (see _pdf_wrapper)
+_PDF_WRAPPER: Optional[type] = None
+
 # Path to the PDF template (relative to project root)
 PDF_TEMPLATE_PATH = "documents/Anmeldung_Meldeschein_20220622.pdf"
 
 
+def _pdf_wrapper() -> type:
+    """
+    Import PyPDFForm's PdfWrapper on first use and cache it.
+
+    PyPDFForm (and pikepdf beneath it) is slow to import, so it is only loaded
+    when a PDF is actually filled, not when the package is imported.
+
+    Returns:
+        The PdfWrapper class
+
+    Raises:
+        ImportError: If PyPDFForm is not installed
+    """
+    global _PDF_WRAPPER
+    if _PDF_WRAPPER is None:
+        try:
+            from PyPDFForm import PdfWrapper
+        except ImportError as exc:
+            raise ImportError(
+                "PyPDFForm is required for PDF generation. "
+                "Install it with: pip install PyPDFForm"
+            ) from exc
+        _PDF_WRAPPER = PdfWrapper
+    return _PDF_WRAPPER
+
+
+@lru_cache(maxsize=1)
+def _template_bytes(path: str) -> bytes:
+    """
+    Read the PDF template once and keep its bytes for later fills.
+
+    Args:
+        path: Path to the PDF template
+
+    Returns:
+        Raw bytes of the template file
+
+    Raises:
+        FileNotFoundError: If the PDF template cannot be found
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"PDF template not found at: {path}\n"
+            f"Expected path: {os.path.abspath(path)}"
+        )
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _identity(value: str) -> Any:
+    """Pass a text, date, or postal code answer through unchanged."""
+    return value
+
+
+def _to_int(value: str) -> Any:
+    """Convert a choice answer to int, falling back to the raw string."""
+    try:
+        return int(value)
+    except ValueError:
+        # If conversion fails, store as string (graceful fallback)
+        return value
+
+
+# voice field_id -> (pdf_field_id, converter), built once from the static field table
+_TRANSFORM: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    field_id: (
+        field_def.pdf_field_id,
+        _to_int if field_def.validator.type == "integer_choice" else _identity,
+    )
+    for field_id, field_def in FIELD_BY_ID.items()
+}
+
+
 def transform_answers_to_pdf_format(voice_answers: Dict[str, str]) -> Dict[str, Any]:
     """
     Transform voice form answers to PDF format.
@@ -53,26 +129,17 @@ def transform_answers_to_pdf_format(voice_answers: Dict[str, str]) -> Dict[str,
         ValueError: If transformation of answers fails
     """
     pdf_data = {}
+    transform = _TRANSFORM
 
     for field_id, value in voice_answers.items():
-        # Look up field definition
-        field_def = FIELD_BY_ID.get(field_id)
-        if not field_def:
+        entry = transform.get(field_id)
+        if entry is None:
             # Skip unknown fields silently (graceful fallback)
             continue
 
-        pdf_field_id = field_def.pdf_field_id
-
         # Convert type based on validator type
-        if field_def.validator.type == "integer_choice":
-            try:
-                pdf_data[pdf_field_id] = int(value)
-            except ValueError:
-                # If conversion fails, store as string (graceful fallback)
-                pdf_data[pdf_field_id] = value
-        else:
-            # Text, date, postal code: store as-is
-            pdf_data[pdf_field_id] = value
+        pdf_field_id, convert = entry
+        pdf_data[pdf_field_id] = convert(value)
 
     return pdf_data
 
@@ -109,21 +176,11 @@ def generate_anmeldung_pdf(
         >>> len(pdf_bytes) > 0
         True
     """
-    # Verify PyPDFForm is available
-    try:
-        from PyPDFForm import PdfWrapper
-    except ImportError:
-        raise ImportError(
-            "PyPDFForm is required for PDF generation. "
-            "Install it with: pip install PyPDFForm"
-        )
+    # Verify PyPDFForm is available (imported here on the first call)
+    PdfWrapper = _pdf_wrapper()
 
-    # Check that template exists
-    if not os.path.exists(PDF_TEMPLATE_PATH):
-        raise FileNotFoundError(
-            f"PDF template not found at: {PDF_TEMPLATE_PATH}\n"
-            f"Expected path: {os.path.abspath(PDF_TEMPLATE_PATH)}"
-        )
+    # Load the template (read from disk on first use only)
+    template = _template_bytes(PDF_TEMPLATE_PATH)
 
     # Transform voice answers to PDF format
     try:
@@ -133,27 +190,29 @@ def generate_anmeldung_pdf(
 
     # Fill the PDF
     try:
-        pdf = PdfWrapper(PDF_TEMPLATE_PATH, use_full_widget_name=True)
+        pdf = PdfWrapper(template, use_full_widget_name=True)
         filled_pdf = pdf.fill(pdf_data)
 
-        # Extract as bytes
-        pdf_buffer = BytesIO()
-        filled_pdf.write(pdf_buffer)
-        pdf_buffer.seek(0)
-        pdf_bytes = pdf_buffer.getvalue()
+        # Extract as bytes (no intermediate buffer copy)
+        pdf_bytes = filled_pdf.read()
     except Exception as e:
         raise Exception(f"PDF filling failed: {e}\nMake sure all required fields are present in the data.")
 
     # Save to file if output path is provided
     if output_path:
         try:
-            # Create directory if needed
-            output_dir = os.path.dirname(output_path)
-            if output_dir:
+            # The directory normally exists already; only create it when the open fails
+            try:
+                f = open(output_path, "wb")
+            except FileNotFoundError:
+                output_dir = os.path.dirname(output_path)
+                if not output_dir:
+                    raise
                 os.makedirs(output_dir, exist_ok=True)
+                f = open(output_path, "wb")
 
             # Write PDF
-            with open(output_path, "wb") as f:
+            with f:
                 f.write(pdf_bytes)
         except Exception as e:
             raise Exception(f"Failed to save PDF to {output_path}: {e}")
@@ -13,13 +13,35 @@ Validators are used both during form filling and PDF generation to ensure data i
 
 from __future__ import annotations
 
-import re
-from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
 ValidationResult = Tuple[bool, str]
 """Result of validation: (is_valid, error_message)."""
 
+_OK: ValidationResult = (True, "")
+"""Shared result for successful validation."""
+
+# Fixed failure results (messages that do not depend on the input)
+_EMPTY_TEXT: ValidationResult = (False, "This field cannot be empty.")
+_EMPTY_DATE: ValidationResult = (False, "Date cannot be empty.")
+_BAD_DATE_FORMAT: ValidationResult = (
+    False,
+    "Invalid format. Use DDMMYYYY (e.g., 15011990 for January 15, 1990).",
+)
+_BAD_DATE: ValidationResult = (False, "Invalid date. Check day (1-31), month (1-12), year.")
+_EMPTY_CHOICE: ValidationResult = (False, "Value cannot be empty.")
+_BAD_CHOICE: ValidationResult = (False, "Must be a whole number (0, 1, 2, etc.).")
+_EMPTY_POSTAL_CODE: ValidationResult = (False, "Postal code cannot be empty.")
+_BAD_POSTAL_CODE: ValidationResult = (False, "Postal code must be 4 or 5 digits.")
+
+# Days per month for a non-leap year (index 0 = January)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Validators are pure, and the model often retries the same value, so the
+# parsing validators memoize their results (bounded, since values are user input)
+_VALIDATOR_CACHE_SIZE = 2048
+
 
 # ============================================================================
 # INTERNAL VALIDATORS (one per type)
@@ -36,9 +58,10 @@ def _validate_non_empty(value: str) -> ValidationResult:
     Returns:
         (True, "") if valid, (False, error_msg) otherwise
     """
-    if value and value.strip():
-        return True, ""
-    return False, "This field cannot be empty."
+    # isspace() is True only for all-whitespace strings, so no stripped copy is needed
+    if value and not value.isspace():
+        return _OK
+    return _EMPTY_TEXT
 
 
 def _validate_text(value: str) -> ValidationResult:
@@ -54,6 +77,7 @@ def _validate_text(value: str) -> ValidationResult:
     return _validate_non_empty(value)
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def _validate_date_de(value: str) -> ValidationResult:
     """
     Validate German date format DDMMYYYY (8 digits, no separators).
@@ -75,27 +99,31 @@ def _validate_date_de(value: str) -> ValidationResult:
         >>> _validate_date_de("32121990")
         (False, "Invalid date...")
     """
-    if not value or not value.strip():
-        return False, "Date cannot be empty."
-
-    # Check format: exactly 8 digits (DDMMYYYY)
-    pattern = r"^\d{8}$"
-    if not re.match(pattern, value.strip()):
-        return False, "Invalid format. Use DDMMYYYY (e.g., 15011990 for January 15, 1990)."
-
-    try:
-        value_str = value.strip()
-        day = int(value_str[0:2])
-        month = int(value_str[2:4])
-        year = int(value_str[4:8])
-
-        # Validate that the date is actually valid
-        datetime(year, month, day)
-        return True, ""
-    except (ValueError, IndexError):
-        return False, "Invalid date. Check day (1-31), month (1-12), year."
-
-
+    value_str = value.strip() if value else ""
+    if not value_str:
+        return _EMPTY_DATE
+
+    # Check format: exactly 8 ASCII digits (DDMMYYYY)
+    if len(value_str) != 8 or not (value_str.isascii() and value_str.isdecimal()):
+        return _BAD_DATE_FORMAT
+
+    # One int parse, then split DD|MM|YYYY arithmetically (no slicing)
+    packed = int(value_str)
+    day, rest = divmod(packed, 1_000_000)
+    month, year = divmod(rest, 10_000)
+
+    # Validate that the date is actually valid (same range rules as datetime)
+    if year < 1 or not 1 <= month <= 12:
+        return _BAD_DATE
+    max_day = _DAYS_IN_MONTH[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        max_day = 29
+    if not 1 <= day <= max_day:
+        return _BAD_DATE
+    return _OK
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def _validate_integer_choice(
     value: str, min_val: int = 0, max_val: Optional[int] = None
 ) -> ValidationResult:
@@ -116,13 +144,14 @@ def _validate_integer_choice(
         >>> _validate_integer_choice("5", 0, 3)
         (False, "Value 5 is too large...")
     """
-    if not value or not value.strip():
-        return False, "Value cannot be empty."
+    value_str = value.strip() if value else ""
+    if not value_str:
+        return _EMPTY_CHOICE
 
     try:
-        num = int(value.strip())
+        num = int(value_str)
     except ValueError:
-        return False, "Must be a whole number (0, 1, 2, etc.)."
+        return _BAD_CHOICE
 
     if num < min_val:
         return False, f"Value {num} is too small (minimum {min_val})."
@@ -130,9 +159,10 @@ def _validate_integer_choice(
     if max_val is not None and num > max_val:
         return False, f"Value {num} is too large (maximum {max_val})."
 
-    return True, ""
+    return _OK
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def _validate_postal_code_de(value: str) -> ValidationResult:
     """
     Validate German postal code (4 or 5 digits).
@@ -151,18 +181,20 @@ def _validate_postal_code_de(value: str) -> ValidationResult:
         >>> _validate_postal_code_de("8080")
         (False, "Postal code must be 4 or 5 digits.")
     """
-    if not value or not value.strip():
-        return False, "Postal code cannot be empty."
-
-    value_stripped = value.strip()
+    value_stripped = value.strip() if value else ""
+    if not value_stripped:
+        return _EMPTY_POSTAL_CODE
 
-    # Accept both 4-digit (older) and 5-digit (standard) postal codes
-    if re.fullmatch(r"\d{5}", value_stripped):
-        return True, ""
-    if re.fullmatch(r"\d{4}", value_stripped):
-        return True, ""
+    # Accept both 4-digit (older) and 5-digit (standard) postal codes;
+    # isascii() keeps non-ASCII decimals (e.g. "١٢٣٤٥") out of isdecimal()
+    if (
+        4 <= len(value_stripped) <= 5
+        and value_stripped.isascii()
+        and value_stripped.isdecimal()
+    ):
+        return _OK
 
-    return False, "Postal code must be 4 or 5 digits."
+    return _BAD_POSTAL_CODE
 
 
 # ============================================================================
@@ -170,6 +202,29 @@ def _validate_postal_code_de(value: str) -> ValidationResult:
 # ============================================================================
 
 
+validate_integer_choice = _validate_integer_choice
+"""Public name for the bounded integer-choice check (value, min_val=0, max_val=None)."""
+
+
+def _validate_integer_choice_config(value: str, config: Dict[str, Any]) -> ValidationResult:
+    """Adapt _validate_integer_choice to the (value, config) dispatch signature."""
+    return _validate_integer_choice(value, config.get("min", 0), config.get("max"))
+
+
+_VALIDATORS: Dict[str, Callable[[str, Dict[str, Any]], ValidationResult]] = {
+    "text": lambda value, _config: _validate_text(value),
+    "date_de": lambda value, _config: _validate_date_de(value),
+    "postal_code_de": lambda value, _config: _validate_postal_code_de(value),
+    "integer_choice": _validate_integer_choice_config,
+}
+"""Map validator type to a (value, config) validator function."""
+
+
+def _validate_passthrough(value: str, config: Dict[str, Any]) -> ValidationResult:
+    """Unknown validator type; pass through as valid (graceful fallback)."""
+    return _OK
+
+
 def validate_by_type(
     validator_type: str, value: str, config: Optional[Dict[str, Any]] = None
 ) -> ValidationResult:
@@ -204,22 +259,4 @@ def validate_by_type(
         >>> validate_by_type("postal_code_de", "80802")
         (True, "")
     """
-    config = config or {}
-
-    if validator_type == "text":
-        return _validate_text(value)
-
-    elif validator_type == "date_de":
-        return _validate_date_de(value)
-
-    elif validator_type == "postal_code_de":
-        return _validate_postal_code_de(value)
-
-    elif validator_type == "integer_choice":
-        min_val = config.get("min", 0)
-        max_val = config.get("max")
-        return _validate_integer_choice(value, min_val, max_val)
-
-    else:
-        # Unknown validator type; pass through as valid (graceful fallback)
-        return True, ""
+    return _VALIDATORS.get(validator_type, _validate_passthrough)(value, config or {})
@@ -8,11 +8,28 @@ This module manages communication with the Gemini Live API:
 
 The LLM module is independent of the core module and can be replaced
 with different LLM integrations if needed.
+
+Exports are resolved lazily (PEP 562): the Gemini SDK and the handler
+dependencies are only imported when the corresponding attribute is used.
 """
 
-from .handlers import handle_tool_calls
-from .prompts import build_system_prompt
-from .tools import build_function_declarations, build_tool_config
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .handlers import handle_tool_calls
+    from .prompts import build_system_prompt
+    from .tools import build_function_declarations, build_tool_config
+
+# Lazily imported attribute -> submodule
+_LAZY = {
+    "handle_tool_calls": ".handlers",
+    "build_system_prompt": ".prompts",
+    "build_function_declarations": ".tools",
+    "build_tool_config": ".tools",
+}
 
 __all__ = [
     # Prompts
@@ -23,3 +40,17 @@ __all__ = [
     # Handlers
     "handle_tool_calls",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported attributes on first access and cache them."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported attributes in dir()."""
+    return sorted(set(globals()) | set(_LAZY))
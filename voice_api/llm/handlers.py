@@ -13,33 +13,47 @@ This module is focused on response logic. Tool definitions are in tools.py.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
-from datetime import datetime
-from typing import Any
+import time
+from typing import Any, Awaitable, Callable, Dict
 
 from google.genai import types
 
+from ..api.context import SESSION_ID_VAR
 from ..api.events import FormEvent, event_emitter
 from ..app.state import FormState
 from ..app.validation import validate_field
 from ..config import LOGGER
-from ..core import generate_anmeldung_pdf
+from ..core import ANMELDUNG_FORM_FIELDS, FIELD_BY_ID, generate_anmeldung_pdf
 
 __all__ = ["handle_tool_calls"]
 
 
+_PAYLOAD_CACHE: dict[int, tuple[Any, dict[str, Any]]] = {}
+"""Per-field payloads keyed by id(field); the field is kept alongside so ids are never reused."""
+
+
 def _field_to_payload(field: Any) -> dict[str, Any]:
     """
     Convert a field to a serializable payload for tool responses.
 
+    Payloads are built once per field object and reused afterwards; callers
+    must treat the returned dict as read-only.
+
     Args:
         field: The field to convert
 
     Returns:
         Dictionary with field metadata for JSON serialization
     """
-    return {
+    cached = _PAYLOAD_CACHE.get(id(field))
+    if cached is not None and cached[0] is field:
+        return cached[1]
+
+    payload = {
         "field_id": field.field_id,
         "label": field.label,
         "description": field.description,
@@ -48,6 +62,438 @@ def _field_to_payload(field: Any) -> dict[str, Any]:
         "examples": field.examples or [],
         "constraints": {},
     }
+    _PAYLOAD_CACHE[id(field)] = (field, payload)
+    return payload
+
+
+# Pre-build payloads for the static form fields so tool calls never build them
+for _field in ANMELDUNG_FORM_FIELDS:
+    _field_to_payload(_field)
+del _field
+
+
+# ============================================================================
+# TOOL HANDLERS (one per tool)
+# ============================================================================
+# Each handler takes (func_call, args, form_state, session_id) and returns the
+# FunctionResponse to send back to the model.
+
+ToolHandler = Callable[
+    [types.FunctionCall, Dict[str, Any], FormState, str], Awaitable[types.FunctionResponse]
+]
+
+
+# Invariant responses for the "no current field" paths; shared, never mutated
+_DONE_RESPONSE: dict[str, Any] = {"done": True}
+_NO_FIELD_VALIDATE: dict[str, Any] = {
+    "is_valid": False,
+    "message": "No field to validate. Call get_next_form_field first.",
+}
+_NO_FIELD_SAVE: dict[str, Any] = {
+    "ok": False,
+    "message": "No field to save. Call get_next_form_field first.",
+}
+
+
+def _response(func_call: types.FunctionCall, response: dict[str, Any]) -> types.FunctionResponse:
+    """Build the FunctionResponse answering ``func_call``."""
+    return types.FunctionResponse(id=func_call.id, name=func_call.name, response=response)
+
+
+def _emit_field_changed(field: Any, form_state: FormState, session_id: str) -> None:
+    """Emit a field_changed event for the field now being collected."""
+    event_emitter.emit_sync(
+        FormEvent(
+            type="field_changed",
+            data={
+                "field_id": field.field_id,
+                "label": field.label,
+                "description": field.description,
+                "examples": field.examples,
+                "current_index": form_state.current_index,
+                "progress_percent": form_state.progress_percent(),
+            },
+            session_id=session_id,
+        )
+    )
+
+
+async def _handle_get_next_form_field(
+    func_call: types.FunctionCall, args: Dict[str, Any], form_state: FormState, session_id: str
+) -> types.FunctionResponse:
+    """Return the current field's metadata, or done=True when the form is finished."""
+    field = form_state.current_field()
+    if not field:
+        return _response(func_call, _DONE_RESPONSE)
+
+    _emit_field_changed(field, form_state, session_id)
+    return _response(func_call, {"done": False, "field": _field_to_payload(field)})
+
+
+async def _handle_validate_form_field(
+    func_call: types.FunctionCall, args: Dict[str, Any], form_state: FormState, session_id: str
+) -> types.FunctionResponse:
+    """Validate a value for the current field without saving it."""
+    provided_field_id = args.get("field_id", "")
+    value = args.get("value", "")
+    field = form_state.current_field()
+    if not field:
+        return _response(func_call, _NO_FIELD_VALIDATE)
+
+    if provided_field_id and provided_field_id != field.field_id:
+        # SAFETY CHECK: field_id must match current field
+        LOGGER.warning(
+            "Field mismatch in validate_form_field: provided=%s, current=%s",
+            provided_field_id,
+            field.field_id,
+        )
+        return _response(
+            func_call,
+            {
+                "is_valid": False,
+                "message": (
+                    f"Field mismatch! You provided field_id='{provided_field_id}' but the current field is "
+                    f"'{field.field_id}' ({field.label}). Call get_next_form_field to get the current field."
+                ),
+            },
+        )
+
+    is_valid, message = validate_field(field, value)
+    if not is_valid:
+        form_state.set_error(field.field_id, message)
+
+    # Emit validation result event
+    event_emitter.emit_sync(
+        FormEvent(
+            type="validation_result",
+            data={
+                "field_id": field.field_id,
+                "value": value,
+                "is_valid": is_valid,
+                "message": message,
+            },
+            session_id=session_id,
+        )
+    )
+
+    return _response(func_call, {"is_valid": is_valid, "message": message})
+
+
+async def _handle_navigate_to_field(
+    func_call: types.FunctionCall, args: Dict[str, Any], form_state: FormState, session_id: str
+) -> types.FunctionResponse:
+    """Move the form cursor to a specific field and return its metadata."""
+    field_id = args.get("field_id", "")
+    field = form_state.navigate_to_field(field_id)
+
+    if not field:
+        return _response(
+            func_call,
+            {
+                "ok": False,
+                "message": f"Field '{field_id}' not found.",
+            },
+        )
+
+    # Emit field changed event for the navigated field
+    _emit_field_changed(field, form_state, session_id)
+
+    return _response(
+        func_call,
+        {
+            "ok": True,
+            "field": _field_to_payload(field),
+            "current_value": form_state.answers.get(field_id, ""),
+        },
+    )
+
+
+async def _handle_save_form_field(
+    func_call: types.FunctionCall, args: Dict[str, Any], form_state: FormState, session_id: str
+) -> types.FunctionResponse:
+    """Validate and save a value for the current field, then advance."""
+    provided_field_id = args.get("field_id", "")
+    value = args.get("value", "")
+    field = form_state.current_field()
+    if not field:
+        return _response(func_call, _NO_FIELD_SAVE)
+
+    if provided_field_id and provided_field_id != field.field_id:
+        # SAFETY CHECK: field_id must match current field
+        LOGGER.warning(
+            "Field mismatch in save_form_field: provided=%s, current=%s, value=%s",
+            provided_field_id,
+            field.field_id,
+            value,
+        )
+        return _response(
+            func_call,
+            {
+                "ok": False,
+                "message": (
+                    f"Field mismatch! You provided field_id='{provided_field_id}' but the current field is "
+                    f"'{field.field_id}' ({field.label}). Call get_next_form_field to get the current field."
+                ),
+            },
+        )
+
+    # SAFETY CHECK: Validate before saving
+    is_valid, message = validate_field(field, value)
+    if not is_valid:
+        return _response(
+            func_call,
+            {
+                "ok": False,
+                "message": f"Cannot save invalid value. Validation failed: {message}",
+            },
+        )
+
+    form_state.record_value(field.field_id, value)
+    # Progress depends only on the answers, so advance() below does not change it
+    progress = form_state.progress_percent()
+
+    # Emit field saved event
+    event_emitter.emit_sync(
+        FormEvent(
+            type="field_saved",
+            data={
+                "field_id": field.field_id,
+                "value": value,
+                "progress_percent": progress,
+            },
+            session_id=session_id,
+        )
+    )
+
+    form_state.advance()
+    return _response(
+        func_call,
+        {
+            "ok": True,
+            "progress_percent": progress,
+        },
+    )
+
+
+async def _handle_get_all_answers(
+    func_call: types.FunctionCall, args: Dict[str, Any], form_state: FormState, session_id: str
+) -> types.FunctionResponse:
+    """List all saved answers with their field metadata."""
+    saved_fields = form_state.saved_fields()
+
+    return _response(
+        func_call,
+        {
+            "saved_fields": saved_fields,
+            "count": len(saved_fields),
+            "current_index": form_state.current_index,
+        },
+    )
+
+
+async def _handle_update_previous_field(
+    func_call: types.FunctionCall, args: Dict[str, Any], form_state: FormState, session_id: str
+) -> types.FunctionResponse:
+    """Correct the value of a field that was already saved."""
+    field_id = args.get("field_id", "")
+    value = args.get("value", "")
+
+    # Validate field_id exists
+    if field_id not in FIELD_BY_ID:
+        return _response(
+            func_call,
+            {
+                "ok": False,
+                "message": f"Unknown field_id: {field_id}. Use get_all_answers to see valid field IDs.",
+            },
+        )
+
+    # Get field definition and index
+    field = FIELD_BY_ID[field_id]
+    field_index = form_state.index_of(field_id)
+    if field_index is None:
+        return _response(
+            func_call,
+            {
+                "ok": False,
+                "message": f"Field {field_id} not in form fields list.",
+            },
+        )
+
+    # SAFETY CHECK 1: Prevent updating fields not yet reached
+    if field_index >= form_state.current_index:
+        return _response(
+            func_call,
+            {
+                "ok": False,
+                "message": (
+                    f"Cannot update {field.label} - you haven't reached this field yet. "
+                    f"Current position: field {form_state.current_index}, "
+                    f"requested field position: {field_index}. "
+                    "You can only update previously saved fields."
+                ),
+            },
+        )
+
+    # SAFETY CHECK 2: Verify field was actually saved
+    if field_id not in form_state.answers:
+        return _response(
+            func_call,
+            {
+                "ok": False,
+                "message": f"Field {field.label} has no saved answer to update.",
+            },
+        )
+
+    # Validate the new value
+    is_valid, message = validate_field(field, value)
+    if not is_valid:
+        return _response(
+            func_call,
+            {
+                "ok": False,
+                "is_valid": False,
+                "message": f"Validation failed: {message}",
+            },
+        )
+
+    # Update the value
+    old_value = form_state.answers[field_id]
+    form_state.record_value(field_id, value)
+
+    LOGGER.info(
+        "Updated field %s (%s) from '%s' to '%s'",
+        field_id,
+        field.label,
+        old_value,
+        value,
+    )
+
+    # Emit field updated event
+    event_emitter.emit_sync(
+        FormEvent(
+            type="field_updated",
+            data={
+                "field_id": field_id,
+                "value": value,
+                "progress_percent": form_state.progress_percent(),
+            },
+            session_id=session_id,
+        )
+    )
+
+    return _response(
+        func_call,
+        {
+            "ok": True,
+            "is_valid": True,
+            "message": f"Successfully updated {field.label}",
+            "old_value": old_value,
+            "new_value": value,
+        },
+    )
+
+
+def _render_and_save(answers: dict[str, str]) -> tuple[str, int]:
+    """
+    Render the Anmeldung PDF and write it to the output folder.
+
+    Blocking; run it via asyncio.to_thread so the event loop keeps streaming audio.
+
+    Args:
+        answers: Collected form answers keyed by field_id
+
+    Returns:
+        Tuple of (output_path, pdf_size_bytes)
+    """
+    # Generate PDF from collected answers
+    pdf_bytes = generate_anmeldung_pdf(answers)
+
+    # Save to output folder with timestamp
+    output_dir = "output"
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    output_filename = f"anmeldung_{timestamp}.pdf"
+    output_path = os.path.join(output_dir, output_filename)
+
+    # The folder normally exists already; only create it when the open fails
+    try:
+        f = open(output_path, "wb")
+    except FileNotFoundError:
+        os.makedirs(output_dir, exist_ok=True)
+        f = open(output_path, "wb")
+    with f:
+        f.write(pdf_bytes)
+
+    return output_path, len(pdf_bytes)
+
+
+async def _handle_generate_anmeldung_pdf(
+    func_call: types.FunctionCall, args: Dict[str, Any], form_state: FormState, session_id: str
+) -> types.FunctionResponse:
+    """Generate the filled PDF from the collected answers and save it to output/."""
+    try:
+        # Snapshot answers so the worker thread never sees concurrent updates
+        output_path, pdf_size = await asyncio.to_thread(
+            _render_and_save, dict(form_state.answers)
+        )
+
+        LOGGER.info("PDF generated and saved to %s", output_path)
+
+        # Emit form complete and PDF generated events
+        event_emitter.emit_sync(
+            FormEvent(
+                type="form_complete",
+                data={
+                    "pdf_location": output_path,
+                    "pdf_size_bytes": pdf_size,
+                },
+                session_id=session_id,
+            )
+        )
+
+        return _response(
+            func_call,
+            {
+                "ok": True,
+                "pdf_location": output_path,
+                "pdf_size_bytes": pdf_size,
+                "message": f"Anmeldung PDF successfully generated and saved to {output_path}",
+            },
+        )
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.error("PDF generation failed: %s", exc)
+        return _response(
+            func_call,
+            {
+                "ok": False,
+                "error": str(exc),
+                "message": "Failed to generate PDF. Please check all required fields are filled.",
+            },
+        )
+
+
+async def _handle_unknown_tool(
+    func_call: types.FunctionCall, args: Dict[str, Any], form_state: FormState, session_id: str
+) -> types.FunctionResponse:
+    """Answer a call to a tool this module does not implement."""
+    return _response(func_call, {"error": f"Unhandled tool {func_call.name}"})
+
+
+_HANDLERS: Dict[str, ToolHandler] = {
+    "get_next_form_field": _handle_get_next_form_field,
+    "validate_form_field": _handle_validate_form_field,
+    "navigate_to_field": _handle_navigate_to_field,
+    "save_form_field": _handle_save_form_field,
+    "get_all_answers": _handle_get_all_answers,
+    "update_previous_field": _handle_update_previous_field,
+    "generate_anmeldung_pdf": _handle_generate_anmeldung_pdf,
+}
+"""Map tool name to its handler coroutine."""
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
 
 
 async def handle_tool_calls(
@@ -56,474 +502,32 @@ async def handle_tool_calls(
     """
     Process tool calls from the model and send responses back.
 
-    Routes to specific handlers for each tool and sends responses to the session.
+    Routes each call to its handler via _HANDLERS and sends the responses to the session.
 
     Args:
         tool_call: ToolCall object from model response
         session: Gemini Live session for sending responses
         form_state: Current form state to update/query
     """
-    if not tool_call.function_calls:
+    calls = tool_call.function_calls
+    if not calls:
         return
-    
-    # Get current session ID from voice runner (lazy import to avoid circular dependency)
-    from ..api.voice_runner import voice_runner
-    session_id = voice_runner.get_current_session_id() or "default"
-
-    responses: list[types.FunctionResponse] = []
-
-    for func_call in tool_call.function_calls:
-        name = func_call.name
-        args = func_call.args or {}
-        LOGGER.info("Tool call: %s args=%s", name, json.dumps(args))
-
-        if name == "get_next_form_field":
-            field = form_state.current_field()
-            if not field:
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={"done": True},
-                    )
-                )
-            else:
-                # Emit field changed event
-                event_emitter.emit_sync(
-                    FormEvent(
-                        type="field_changed",
-                        data={
-                            "field_id": field.field_id,
-                            "label": field.label,
-                            "description": field.description,
-                            "examples": field.examples,
-                            "current_index": form_state.current_index,
-                            "progress_percent": form_state.progress_percent(),
-                        },
-                        session_id=session_id,
-                    )
-                )
-                
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={"done": False, "field": _field_to_payload(field)},
-                    )
-                )
-
-        elif name == "validate_form_field":
-            provided_field_id = args.get("field_id", "")
-            value = args.get("value", "")
-            field = form_state.current_field()
-            if not field:
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "is_valid": False,
-                            "message": "No field to validate. Call get_next_form_field first.",
-                        },
-                    )
-                )
-            elif provided_field_id and provided_field_id != field.field_id:
-                # SAFETY CHECK: field_id must match current field
-                LOGGER.warning(
-                    "Field mismatch in validate_form_field: provided=%s, current=%s",
-                    provided_field_id,
-                    field.field_id,
-                )
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "is_valid": False,
-                            "message": (
-                                f"Field mismatch! You provided field_id='{provided_field_id}' but the current field is "
-                                f"'{field.field_id}' ({field.label}). Call get_next_form_field to get the current field."
-                            ),
-                        },
-                    )
-                )
-            else:
-                is_valid, message = validate_field(field, value)
-                if not is_valid:
-                    form_state.set_error(field.field_id, message)
-                
-                # Emit validation result event
-                event_emitter.emit_sync(
-                    FormEvent(
-                        type="validation_result",
-                        data={
-                            "field_id": field.field_id,
-                            "value": value,
-                            "is_valid": is_valid,
-                            "message": message,
-                        },
-                        session_id=session_id,
-                    )
-                )
-                
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={"is_valid": is_valid, "message": message},
-                    )
-                )
-
-        elif name == "navigate_to_field":
-            field_id = args.get("field_id", "")
-            field = form_state.navigate_to_field(field_id)
-            
-            if not field:
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": False,
-                            "message": f"Field '{field_id}' not found.",
-                        },
-                    )
-                )
-            else:
-                # Emit field changed event for the navigated field
-                event_emitter.emit_sync(
-                    FormEvent(
-                        type="field_changed",
-                        data={
-                            "field_id": field.field_id,
-                            "label": field.label,
-                            "description": field.description,
-                            "examples": field.examples,
-                            "current_index": form_state.current_index,
-                            "progress_percent": form_state.progress_percent(),
-                        },
-                        session_id=session_id,
-                    )
-                )
-                
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": True,
-                            "field": _field_to_payload(field),
-                            "current_value": form_state.answers.get(field_id, ""),
-                        },
-                    )
-                )
-
-        elif name == "save_form_field":
-            provided_field_id = args.get("field_id", "")
-            value = args.get("value", "")
-            field = form_state.current_field()
-            if not field:
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": False,
-                            "message": "No field to save. Call get_next_form_field first.",
-                        },
-                    )
-                )
-            elif provided_field_id and provided_field_id != field.field_id:
-                # SAFETY CHECK: field_id must match current field
-                LOGGER.warning(
-                    "Field mismatch in save_form_field: provided=%s, current=%s, value=%s",
-                    provided_field_id,
-                    field.field_id,
-                    value,
-                )
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": False,
-                            "message": (
-                                f"Field mismatch! You provided field_id='{provided_field_id}' but the current field is "
-                                f"'{field.field_id}' ({field.label}). Call get_next_form_field to get the current field."
-                            ),
-                        },
-                    )
-                )
-            else:
-                # SAFETY CHECK: Validate before saving
-                is_valid, message = validate_field(field, value)
-                if not is_valid:
-                    responses.append(
-                        types.FunctionResponse(
-                            id=func_call.id,
-                            name=name,
-                            response={
-                                "ok": False,
-                                "message": f"Cannot save invalid value. Validation failed: {message}",
-                            },
-                        )
-                    )
-                else:
-                    form_state.record_value(field.field_id, value)
-                    
-                    # Emit field saved event
-                    event_emitter.emit_sync(
-                        FormEvent(
-                            type="field_saved",
-                            data={
-                                "field_id": field.field_id,
-                                "value": value,
-                                "progress_percent": form_state.progress_percent(),
-                            },
-                            session_id=session_id,
-                        )
-                    )
-
-                    form_state.advance()
-                    responses.append(
-                        types.FunctionResponse(
-                            id=func_call.id,
-                            name=name,
-                            response={
-                                "ok": True,
-                                "progress_percent": form_state.progress_percent(),
-                            },
-                        )
-                    )
-
-        elif name == "get_all_answers":
-            # Build list of all saved answers with field metadata
-            from ..core import FIELD_BY_ID
-
-            saved_fields = []
-            for field_id, value in form_state.answers.items():
-                # Get field definition from FIELD_BY_ID
-                field = FIELD_BY_ID.get(field_id)
-                if field:
-                    try:
-                        field_index = form_state.fields.index(field)
-                    except ValueError:
-                        field_index = -1
-                    saved_fields.append(
-                        {
-                            "field_id": field_id,
-                            "label": field.label,
-                            "value": value,
-                            "field_index": field_index,
-                        }
-                    )
-
-            responses.append(
-                types.FunctionResponse(
-                    id=func_call.id,
-                    name=name,
-                    response={
-                        "saved_fields": saved_fields,
-                        "count": len(saved_fields),
-                        "current_index": form_state.current_index,
-                    },
-                )
-            )
 
-        elif name == "update_previous_field":
-            field_id = args.get("field_id", "")
-            value = args.get("value", "")
-
-            # Import FIELD_BY_ID for field lookup
-            from ..core import FIELD_BY_ID
-
-            # Validate field_id exists
-            if field_id not in FIELD_BY_ID:
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": False,
-                            "message": f"Unknown field_id: {field_id}. Use get_all_answers to see valid field IDs.",
-                        },
-                    )
-                )
-                continue
-
-            # Get field definition and index
-            field = FIELD_BY_ID[field_id]
-            try:
-                field_index = form_state.fields.index(field)
-            except ValueError:
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": False,
-                            "message": f"Field {field_id} not in form fields list.",
-                        },
-                    )
-                )
-                continue
-
-            # SAFETY CHECK 1: Prevent updating fields not yet reached
-            if field_index >= form_state.current_index:
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": False,
-                            "message": (
-                                f"Cannot update {field.label} - you haven't reached this field yet. "
-                                f"Current position: field {form_state.current_index}, "
-                                f"requested field position: {field_index}. "
-                                "You can only update previously saved fields."
-                            ),
-                        },
-                    )
-                )
-                continue
-
-            # SAFETY CHECK 2: Verify field was actually saved
-            if field_id not in form_state.answers:
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": False,
-                            "message": f"Field {field.label} has no saved answer to update.",
-                        },
-                    )
-                )
-                continue
-
-            # Validate the new value
-            is_valid, message = validate_field(field, value)
-
-            if not is_valid:
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": False,
-                            "is_valid": False,
-                            "message": f"Validation failed: {message}",
-                        },
-                    )
-                )
-            else:
-                # Update the value
-                old_value = form_state.answers[field_id]
-                form_state.record_value(field_id, value)
-
-                LOGGER.info(
-                    "Updated field %s (%s) from '%s' to '%s'",
-                    field_id,
-                    field.label,
-                    old_value,
-                    value,
-                )
-
-                # Emit field updated event
-                event_emitter.emit_sync(
-                    FormEvent(
-                        type="field_updated",
-                        data={
-                            "field_id": field_id,
-                            "value": value,
-                            "progress_percent": form_state.progress_percent(),
-                        },
-                        session_id=session_id,
-                    )
-                )
-
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": True,
-                            "is_valid": True,
-                            "message": f"Successfully updated {field.label}",
-                            "old_value": old_value,
-                            "new_value": value,
-                        },
-                    )
-                )
-
-        elif name == "generate_anmeldung_pdf":
-            try:
-                # Generate PDF from collected answers
-                pdf_bytes = generate_anmeldung_pdf(form_state.answers)
-
-                # Save to output folder with timestamp
-                output_dir = "output"
-                os.makedirs(output_dir, exist_ok=True)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_filename = f"anmeldung_{timestamp}.pdf"
-                output_path = os.path.join(output_dir, output_filename)
-
-                with open(output_path, "wb") as f:
-                    f.write(pdf_bytes)
-
-                LOGGER.info("PDF generated and saved to %s", output_path)
-                
-                # Emit form complete and PDF generated events
-                event_emitter.emit_sync(
-                    FormEvent(
-                        type="form_complete",
-                        data={
-                            "pdf_location": output_path,
-                            "pdf_size_bytes": len(pdf_bytes),
-                        },
-                        session_id=session_id,
-                    )
-                )
-
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": True,
-                            "pdf_location": output_path,
-                            "pdf_size_bytes": len(pdf_bytes),
-                            "message": f"Anmeldung PDF successfully generated and saved to {output_path}",
-                        },
-                    )
-                )
-            except Exception as exc:  # noqa: BLE001
-                LOGGER.error("PDF generation failed: %s", exc)
-                responses.append(
-                    types.FunctionResponse(
-                        id=func_call.id,
-                        name=name,
-                        response={
-                            "ok": False,
-                            "error": str(exc),
-                            "message": "Failed to generate PDF. Please check all required fields are filled.",
-                        },
-                    )
-                )
-
-        else:
-            responses.append(
-                types.FunctionResponse(
-                    id=func_call.id,
-                    name=name,
-                    response={"error": f"Unhandled tool {name}"},
-                )
-            )
+    session_id = SESSION_ID_VAR.get()
+
+    # One response per call, filled in order
+    responses: list[types.FunctionResponse] = [None] * len(calls)  # type: ignore[list-item]
+
+    for i, func_call in enumerate(calls):
+        handler = _HANDLERS.get(func_call.name, _handle_unknown_tool)
+        responses[i] = await handler(func_call, func_call.args or {}, form_state, session_id)
 
-    if responses:
+    # Single gated log line: no JSON is built unless INFO is enabled
+    if LOGGER.isEnabledFor(logging.INFO):
         log_payload = [
-            {"id": r.id, "name": r.name, "response": r.response} for r in responses
+            {"id": r.id, "name": r.name, "args": c.args or {}, "response": r.response}
+            for c, r in zip(calls, responses)
         ]
-        LOGGER.info("Tool responses: %s", json.dumps(log_payload))
-        await session.send_tool_response(function_responses=responses)
-        LOGGER.debug("Sent %s tool responses", len(responses))
+        LOGGER.info("Tool calls: %s", json.dumps(log_payload, separators=(",", ":")))
+    await session.send_tool_response(function_responses=responses)
+    LOGGER.debug("Sent %s tool responses", len(responses))
@@ -21,6 +21,10 @@ PROMPT STRUCTURE:
 
 from __future__ import annotations
 
+from functools import lru_cache
+from string import Template
+from typing import Final
+
 from ..core import ANMELDUNG_FORM_FIELDS
 
 # ============================================================================
@@ -28,7 +32,7 @@ from ..core import ANMELDUNG_FORM_FIELDS
 # ============================================================================
 # How to begin the conversation with the user
 
-CONVERSATION_STARTER = """\
+CONVERSATION_STARTER: Final[str] = """\
 Welcome the user warmly and directly without waiting for them to greet you first.
 Begin by explaining that you'll help them complete a registration form with friendly questions.
 """
@@ -38,7 +42,7 @@ Begin by explaining that you'll help them complete a registration form with frie
 # ============================================================================
 # Defines the assistant's persona and communication style
 
-ROLE_AND_TONE = """\
+ROLE_AND_TONE: Final[str] = """\
 You are a helpful and friendly assistant guiding a user through completing a German registration form (Anmeldung).
 Be concise, clear, and professional. Speak naturally, one question at a time.
 Maintain a supportive tone and help the user feel confident about their answers.
@@ -51,7 +55,7 @@ If validation fails, patiently ask the user to correct their answer - never skip
 # ============================================================================
 # The mandatory sequence the assistant must follow
 
-WORKFLOW_INSTRUCTIONS = """\
+WORKFLOW_INSTRUCTIONS: Final[str] = """\
 You MUST follow this exact sequence for EVERY field:
 
 1. IMMEDIATELY call get_next_form_field() to retrieve the CURRENT field metadata (note the field_id!)
@@ -95,13 +99,13 @@ For the current field, use the normal validate/save workflow instead.
 # Information about the fields to collect (generated from definitions)
 
 
+@lru_cache(maxsize=1)
 def _build_field_list() -> str:
-    """Generate formatted list of all fields to collect."""
-    field_lines = [f"  • {f.label}: {f.description}" for f in ANMELDUNG_FORM_FIELDS]
-    return "\n".join(field_lines)
+    """Generate formatted list of all fields to collect (cached)."""
+    return "\n".join(f"  • {f.label}: {f.description}" for f in ANMELDUNG_FORM_FIELDS)
 
 
-FIELD_COLLECTION_HEADER = """\
+FIELD_COLLECTION_HEADER: Final[str] = """\
 These are all the fields you need to collect in order:
 """
 
@@ -110,7 +114,7 @@ These are all the fields you need to collect in order:
 # ============================================================================
 # Format and constraint rules for specific field types
 
-VALIDATION_RULES = """\
+VALIDATION_RULES: Final[str] = """\
 These rules are for backend validation. You do NOT need to mention them to the user:
 
 Date fields:
@@ -144,7 +148,7 @@ Do NOT recite field descriptions or option lists to the user. Ask conversational
 # ============================================================================
 # Important notes about how to call the available tools
 
-TOOL_USAGE_GUIDELINES = """\
+TOOL_USAGE_GUIDELINES: Final[str] = """\
 Tool calling guidelines:
 
 get_next_form_field():
@@ -213,7 +217,7 @@ The tools expect correctly formatted data. Always confirm updates explicitly to
 # ============================================================================
 # What to do when the form is finished
 
-COMPLETION_INSTRUCTIONS = """\
+COMPLETION_INSTRUCTIONS: Final[str] = """\
 When form collection is complete:
 
 1. Acknowledge that all fields have been successfully collected and validated
@@ -223,17 +227,47 @@ When form collection is complete:
 """
 
 
+# ============================================================================
+# PROMPT TEMPLATE
+# ============================================================================
+# Everything except the field list is static, so the full layout is joined once
+# at import. string.Template is used because the sections contain literal braces.
+
+_PROMPT_TEMPLATE: Final[Template] = Template(
+    "\n".join(
+        [
+            CONVERSATION_STARTER,
+            "",
+            ROLE_AND_TONE,
+            "",
+            WORKFLOW_INSTRUCTIONS,
+            "",
+            FIELD_COLLECTION_HEADER,
+            "$field_list",
+            "",
+            VALIDATION_RULES,
+            "",
+            TOOL_USAGE_GUIDELINES,
+            "",
+            COMPLETION_INSTRUCTIONS,
+        ]
+    )
+)
+
+
 # ============================================================================
 # PUBLIC API
 # ============================================================================
 
 
+@lru_cache(maxsize=1)
 def build_system_prompt() -> str:
     """
     Generate the complete system prompt with field information.
 
     Assembles all prompt sections into a cohesive instruction set for Gemini Live.
     This ensures the system prompt always reflects the current field definitions.
+    The result is cached; later calls return the same string.
 
     Returns:
         Complete system prompt string ready for Gemini Live API
@@ -246,23 +280,15 @@ def build_system_prompt() -> str:
             ...
         }
     """
-    field_list = _build_field_list()
-
-    sections = [
-        CONVERSATION_STARTER,
-        "",
-        ROLE_AND_TONE,
-        "",
-        WORKFLOW_INSTRUCTIONS,
-        "",
-        FIELD_COLLECTION_HEADER,
-        field_list,
-        "",
-        VALIDATION_RULES,
-        "",
-        TOOL_USAGE_GUIDELINES,
-        "",
-        COMPLETION_INSTRUCTIONS,
-    ]
-
-    return "\n".join(sections)
+    return _PROMPT_TEMPLATE.substitute(field_list=_build_field_list())
+
+
+def invalidate_prompt_cache() -> None:
+    """
+    Drop the cached system prompt and field list.
+
+    Only needed if ANMELDUNG_FORM_FIELDS is changed at runtime (e.g. in tests);
+    the next build_system_prompt() call re-renders from the current fields.
+    """
+    _build_field_list.cache_clear()
+    build_system_prompt.cache_clear()
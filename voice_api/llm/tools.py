@@ -14,40 +14,22 @@ is in handlers.py.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import List
 
 from google.genai import types
 
-from ..core import AnmeldungField
-
 __all__ = ["build_function_declarations", "build_tool_config"]
 
 
-def _field_to_payload(field: AnmeldungField) -> Dict[str, Any]:
-    """
-    Convert an AnmeldungField to a serializable payload for tool responses.
-
-    Args:
-        field: The field to convert
-
-    Returns:
-        Dictionary with field metadata for JSON serialization
-    """
-    return {
-        "field_id": field.field_id,
-        "label": field.label,
-        "description": field.description,
-        "field_type": field.validator.type,
-        "required": field.required,
-        "examples": field.examples or [],
-        "constraints": {},
-    }
-
-
+@lru_cache(maxsize=1)
 def build_function_declarations() -> List[types.FunctionDeclaration]:
     """
     Define all tool functions exposed to the model.
 
+    The declarations are static, so they are built once and the same list is
+    returned on later calls; callers must not mutate it.
+
     Returns:
         List of FunctionDeclaration objects for the Gemini Live session
     """
@@ -164,9 +146,10 @@ def build_function_declarations() -> List[types.FunctionDeclaration]:
     ]
 
 
+@lru_cache(maxsize=1)
 def build_tool_config() -> types.Tool:
     """
-    Construct the Tool configuration object for the live session.
+    Construct the Tool configuration object for the live session (cached).
 
     Returns:
         Tool object with all function declarations ready for Gemini Live
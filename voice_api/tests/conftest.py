@@ -1 +1,67 @@
 """Test configuration and fixtures."""
+
+import pytest
+
+from voice_api.core import FIELD_BY_ID
+
+
+@pytest.fixture(scope="session")
+def field_by_id():
+    """Field definitions keyed by field_id, shared by the whole test session."""
+    return FIELD_BY_ID
+
+
+@pytest.fixture(scope="session")
+def system_prompt():
+    """The built system prompt, shared by the whole test session."""
+    from voice_api.llm import build_system_prompt
+
+    return build_system_prompt()
+
+
+@pytest.fixture
+def form_state():
+    """A fresh FormState at the start of the form."""
+    from voice_api.app.state import FormState
+
+    return FormState()
+
+
+@pytest.fixture(scope="session")
+def _progress_snapshots():
+    """FormState snapshots by progress: entry ``n`` has the first ``n`` fields saved as "test"."""
+    from voice_api.app.state import FormState
+
+    form_state = FormState()
+    snapshots = [form_state.snapshot()]
+    while (field := form_state.current_field()) is not None:
+        form_state.record_value(field.field_id, "test")
+        form_state.advance()
+        snapshots.append(form_state.snapshot())
+    return snapshots
+
+
+@pytest.fixture
+def form_state_at(_progress_snapshots):
+    """Factory for a fresh FormState with the first ``n`` fields saved as "test"."""
+    from voice_api.app.state import FormState
+
+    def _form_state_at(n):
+        form_state = FormState()
+        form_state.restore(_progress_snapshots[n])
+        return form_state
+
+    return _form_state_at
+
+
+@pytest.fixture
+def state_at_field(form_state_at):
+    """Factory for a FormState positioned on ``field_id`` with every earlier field saved."""
+    from voice_api.app.state import FormState
+
+    positions = FormState()
+
+    def _state_at_field(field_id):
+        return form_state_at(positions.index_of(field_id))
+
+    return _state_at_field
@@ -214,6 +214,22 @@ class TestPdfFormatTransformation:
         assert pdf_data["wohnung"] == 1
 
 
+class TestPdfGeneration:
+    """Test saving generated PDFs to disk."""
+
+    def test_recreates_deleted_output_directory(self, tmp_path):
+        """Saving should recreate the output directory if it was removed after a save."""
+        output_dir = tmp_path / "output"
+        answers = {"family_name_p1": "Mueller"}
+
+        generate_anmeldung_pdf(answers, str(output_dir / "first.pdf"))
+        (output_dir / "first.pdf").unlink()
+        output_dir.rmdir()
+
+        pdf_bytes = generate_anmeldung_pdf(answers, str(output_dir / "second.pdf"))
+        assert (output_dir / "second.pdf").read_bytes() == pdf_bytes
+
+
 class TestEnumDisplay:
     """Test human-readable enum value display."""
 
@@ -1,5 +1,7 @@
 """Tests for voice_api.core.fields module."""
 
+import pickle
+
 import pytest
 from voice_api.core.fields import (
     AnmeldungField,
@@ -145,7 +147,7 @@ class TestFieldExamples:
         for field in ANMELDUNG_FORM_FIELDS:
             if field.examples:
                 has_examples += 1
-                assert isinstance(field.examples, list)
+                assert isinstance(field.examples, tuple)
                 if field.examples:
                     assert isinstance(field.examples[0], str)
         
@@ -242,6 +244,23 @@ class TestFieldSerializability:
             _ = field.validator
             _ = field.required
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(ANMELDUNG_FORM_FIELDS, id="form_fields"),
+            pytest.param(FIELD_BY_ID, id="field_by_id"),
+            pytest.param(FIELD_BY_PDF_ID, id="field_by_pdf_id"),
+        ],
+    )
+    def test_pickle_round_trip(self, value):
+        """Field definitions and lookup maps should pickle and compare equal."""
+        assert pickle.loads(pickle.dumps(value)) == value
+
+    def test_lookup_maps_read_only(self):
+        """Shared lookup maps should reject mutation."""
+        with pytest.raises(TypeError):
+            FIELD_BY_ID["new_field"] = ANMELDUNG_FORM_FIELDS[0]
+
 
 class TestAnmeldungFieldDefaults:
     """Test default behaviors."""
@@ -256,7 +275,7 @@ class TestAnmeldungFieldDefaults:
     def test_examples_optional(self):
         """examples should be optional."""
         for field in ANMELDUNG_FORM_FIELDS:
-            assert field.examples is None or isinstance(field.examples, list)
+            assert field.examples is None or isinstance(field.examples, tuple)
 
 
 class TestCompleteFormSet:
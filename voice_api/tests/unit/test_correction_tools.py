@@ -2,6 +2,7 @@
 
 import pytest
 from voice_api.app.state import FormState
+from voice_api.app.validation import validate_field
 from voice_api.core import ANMELDUNG_FORM_FIELDS, FIELD_BY_ID
 
 
@@ -12,15 +13,7 @@ class TestGetAllAnswers:
         """get_all_answers returns empty list when no fields saved."""
         form_state = FormState()
         
-        saved_fields = []
-        for field_id, value in form_state.answers.items():
-            field = FIELD_BY_ID.get(field_id)
-            if field:
-                saved_fields.append({
-                    "field_id": field_id,
-                    "label": field.label,
-                    "value": value,
-                })
+        saved_fields = form_state.saved_fields()
         
         assert len(saved_fields) == 0
         assert form_state.current_index == 0
@@ -38,25 +31,14 @@ class TestGetAllAnswers:
         form_state.record_value(field2.field_id, "Hans")
         form_state.advance()
         
-        # Build response like handler does
-        saved_fields = []
-        for field_id, value in form_state.answers.items():
-            field = FIELD_BY_ID.get(field_id)
-            if field:
-                try:
-                    field_index = form_state.fields.index(field)
-                except ValueError:
-                    field_index = -1
-                saved_fields.append({
-                    "field_id": field_id,
-                    "label": field.label,
-                    "value": value,
-                    "field_index": field_index,
-                })
-        
-        assert len(saved_fields) == 2
-        assert saved_fields[0]["value"] == "Mueller"
-        assert saved_fields[1]["value"] == "Hans"
+        # Same list the get_all_answers handler returns
+        saved_fields = form_state.saved_fields()
+        
+        assert form_state.answers == {field1.field_id: "Mueller", field2.field_id: "Hans"}
+        assert saved_fields == [
+            {"field_id": field1.field_id, "label": field1.label, "value": "Mueller", "field_index": 0},
+            {"field_id": field2.field_id, "label": field2.label, "value": "Hans", "field_index": 1},
+        ]
         assert form_state.current_index == 2
 
     def test_get_all_answers_includes_field_metadata(self):
@@ -68,37 +50,35 @@ class TestGetAllAnswers:
         form_state.advance()
         
         # Check metadata
-        field_id = list(form_state.answers.keys())[0]
+        field_id = next(iter(form_state.answers))
         field = FIELD_BY_ID.get(field_id)
         
         assert field is not None
         assert field.field_id == field1.field_id
         assert field.label == field1.label
 
+    def test_get_all_answers_skips_unknown_field_ids(self):
+        """Answers for unknown field_ids are left out."""
+        form_state = FormState()
+        form_state.record_value("nonexistent_field", "x")
+        
+        assert form_state.saved_fields() == []
+
 
 class TestUpdatePreviousField:
     """Test update_previous_field functionality."""
 
-    def test_update_previous_field_success(self):
+    def test_update_previous_field_success(self, form_state_at):
         """Successfully update a previously saved field."""
-        form_state = FormState()
-        
-        # Save first field
-        field1 = form_state.current_field()
-        form_state.record_value(field1.field_id, "Mueller")
-        form_state.advance()
-        
-        # Save second field
-        field2 = form_state.current_field()
-        form_state.record_value(field2.field_id, "Hans")
-        form_state.advance()
+        form_state = form_state_at(2)
+        field1 = form_state.fields[0]
         
         # Now on field 3, update field 1
         old_value = form_state.answers[field1.field_id]
         form_state.record_value(field1.field_id, "Mueller-Schmidt")
         new_value = form_state.answers[field1.field_id]
         
-        assert old_value == "Mueller"
+        assert old_value == "test"
         assert new_value == "Mueller-Schmidt"
         assert form_state.current_index == 2  # Should not advance
 
@@ -118,35 +98,25 @@ class TestUpdatePreviousField:
         
         # Try to update field 2 (not reached yet)
         future_field = form_state.fields[2]
-        field_index = form_state.fields.index(future_field)
+        field_index = form_state.index_of(future_field.field_id)
         
         # Safety check should fail
         assert field_index >= form_state.current_index
 
-    def test_update_previous_field_current_field_blocked(self):
+    def test_update_previous_field_current_field_blocked(self, form_state_at):
         """Block update to current field."""
-        form_state = FormState()
-        
-        # Save field 0
-        field1 = form_state.current_field()
-        form_state.record_value(field1.field_id, "Mueller")
-        form_state.advance()
+        form_state = form_state_at(1)
         
         # Now on field 1 (current)
         current_field = form_state.current_field()
-        current_index = form_state.fields.index(current_field)
+        current_index = form_state.index_of(current_field.field_id)
         
         # Safety check should block
         assert current_index >= form_state.current_index
 
-    def test_update_previous_field_not_saved(self):
+    def test_update_previous_field_not_saved(self, form_state_at):
         """Block update to field not previously saved."""
-        form_state = FormState()
-        
-        # Save field 0
-        field1 = form_state.current_field()
-        form_state.record_value(field1.field_id, "Mueller")
-        form_state.advance()
+        form_state = form_state_at(1)
         
         # Advance past field 1 without saving it (if optional)
         form_state.advance()
@@ -155,16 +125,10 @@ class TestUpdatePreviousField:
         field1_next = form_state.fields[1]
         assert field1_next.field_id not in form_state.answers
 
-    def test_update_previous_field_validates_value(self):
+    def test_update_previous_field_validates_value(self, form_state_at):
         """Update should validate new value."""
-        from voice_api.app.validation import validate_field
-        
-        form_state = FormState()
-        
-        # Save first field (family_name)
-        field1 = form_state.current_field()
-        form_state.record_value(field1.field_id, "Mueller")
-        form_state.advance()
+        form_state = form_state_at(1)
+        field1 = form_state.fields[0]
         
         # Move forward
         form_state.advance()
@@ -173,18 +137,10 @@ class TestUpdatePreviousField:
         is_valid, message = validate_field(field1, "")
         assert not is_valid
 
-    def test_update_previous_field_maintains_index(self):
+    def test_update_previous_field_maintains_index(self, form_state_at):
         """Update should not change current_index."""
-        form_state = FormState()
-        
-        # Save first two fields
-        field1 = form_state.current_field()
-        form_state.record_value(field1.field_id, "Mueller")
-        form_state.advance()
-        
-        field2 = form_state.current_field()
-        form_state.record_value(field2.field_id, "Hans")
-        form_state.advance()
+        form_state = form_state_at(2)
+        field1 = form_state.fields[0]
         
         current_index_before = form_state.current_index
         
@@ -193,101 +149,93 @@ class TestUpdatePreviousField:
         
         assert form_state.current_index == current_index_before
 
-    def test_update_previous_field_date_format(self):
+    def test_update_previous_field_date_format(self, state_at_field):
         """Update date field with valid format."""
-        from voice_api.app.validation import validate_field
+        birth_date_field = FIELD_BY_ID["birth_date_p1"]
+        form_state = state_at_field("birth_date_p1")
         
-        form_state = FormState()
+        # Save birth date
+        form_state.record_value("birth_date_p1", "01011990")
+        form_state.advance()
+        
+        # Move forward
+        form_state.advance()
+        
+        # Update with new valid date
+        is_valid, message = validate_field(birth_date_field, "15101999")
+        assert is_valid
         
-        # Find and save birth_date field
-        birth_date_field = None
-        for i, field in enumerate(form_state.fields):
-            if field.field_id == "birth_date_p1":
-                birth_date_field = field
-                break
-        
-        if birth_date_field:
-            # Advance to birth_date field
-            while form_state.current_field().field_id != "birth_date_p1":
-                current = form_state.current_field()
-                form_state.record_value(current.field_id, "test")
-                form_state.advance()
-            
-            # Save birth date
-            form_state.record_value("birth_date_p1", "01011990")
-            form_state.advance()
-            
-            # Move forward
-            form_state.advance()
-            
-            # Update with new valid date
-            is_valid, message = validate_field(birth_date_field, "15101999")
-            assert is_valid
-            
-            form_state.record_value("birth_date_p1", "15101999")
-            assert form_state.answers["birth_date_p1"] == "15101999"
-
-    def test_update_previous_field_choice_field(self):
+        form_state.record_value("birth_date_p1", "15101999")
+        assert form_state.answers["birth_date_p1"] == "15101999"
+
+    def test_update_previous_field_choice_field(self, state_at_field):
         """Update choice field with valid option."""
-        from voice_api.app.validation import validate_field
+        gender_field = FIELD_BY_ID["gender_p1"]
+        form_state = state_at_field("gender_p1")
         
-        form_state = FormState()
+        # Save gender
+        form_state.record_value("gender_p1", "0")
+        form_state.advance()
         
-        # Find gender field
-        gender_field = None
-        for field in form_state.fields:
-            if field.field_id == "gender_p1":
-                gender_field = field
-                break
-        
-        if gender_field:
-            # Advance to gender field
-            while form_state.current_field().field_id != "gender_p1":
-                current = form_state.current_field()
-                form_state.record_value(current.field_id, "test")
-                form_state.advance()
-            
-            # Save gender
-            form_state.record_value("gender_p1", "0")
-            form_state.advance()
-            
-            # Move forward
-            form_state.advance()
-            
-            # Update with new valid choice
-            is_valid, message = validate_field(gender_field, "1")
-            assert is_valid
-            
-            form_state.record_value("gender_p1", "1")
-            assert form_state.answers["gender_p1"] == "1"
+        # Move forward
+        form_state.advance()
+        
+        # Update with new valid choice
+        is_valid, message = validate_field(gender_field, "1")
+        assert is_valid
+        
+        form_state.record_value("gender_p1", "1")
+        assert form_state.answers["gender_p1"] == "1"
+
+
+class TestSnapshotRestore:
+    """Test FormState snapshot/restore."""
+
+    def test_restore_round_trips_progress(self, form_state_at):
+        """restore() brings back position, answers and errors."""
+        form_state = form_state_at(2)
+        form_state.set_error("family_name_p1", "bad")
+        snapshot = form_state.snapshot()
+
+        form_state.advance()
+        form_state.record_value("family_name_p1", "changed")
+        form_state.restore(snapshot)
+
+        assert form_state.current_index == 2
+        assert form_state.answers[form_state.fields[0].field_id] == "test"
+        assert form_state.validation_errors == {"family_name_p1": "bad"}
+
+    def test_restore_does_not_share_snapshot_dicts(self, form_state_at):
+        """Mutating a restored state leaves the snapshot untouched."""
+        snapshot = form_state_at(1).snapshot()
+        form_state = FormState()
+        form_state.restore(snapshot)
+
+        form_state.record_value("extra", "value")
+
+        assert "extra" not in snapshot[1]
 
 
 class TestBackwardOnlyConstraint:
     """Test that backward-only constraint is enforced."""
 
-    def test_can_only_update_completed_fields(self):
+    @pytest.mark.parametrize(
+        "field_index,expected",
+        [
+            pytest.param(0, True, id="completed-0"),
+            pytest.param(1, True, id="completed-1"),
+            pytest.param(2, True, id="completed-2"),
+            pytest.param(3, False, id="current"),
+            pytest.param(4, False, id="future"),
+        ],
+    )
+    def test_can_only_update_completed_fields(self, form_state_at, field_index, expected):
         """Verify field_index < current_index constraint."""
-        form_state = FormState()
-        
-        # Save first 3 fields
-        for _ in range(3):
-            current = form_state.current_field()
-            form_state.record_value(current.field_id, "test")
-            form_state.advance()
-        
+        form_state = form_state_at(3)
+
         # Now on field 3 (index 3)
         assert form_state.current_index == 3
-        
-        # Can update fields 0, 1, 2
-        for i in range(3):
-            field_index = i
-            assert field_index < form_state.current_index
-        
-        # Cannot update field 3 (current)
-        assert 3 >= form_state.current_index
-        
-        # Cannot update field 4 (future)
-        assert 4 >= form_state.current_index
+        assert (field_index < form_state.current_index) is expected
 
     def test_field_index_calculation(self):
         """Verify field index is calculated correctly."""
@@ -297,6 +245,14 @@ class TestBackwardOnlyConstraint:
         field2 = form_state.fields[1]
         field3 = form_state.fields[2]
         
-        assert form_state.fields.index(field1) == 0
-        assert form_state.fields.index(field2) == 1
-        assert form_state.fields.index(field3) == 2
+        assert form_state.index_of(field1.field_id) == 0
+        assert form_state.index_of(field2.field_id) == 1
+        assert form_state.index_of(field3.field_id) == 2
+
+    def test_index_of_matches_field_order(self):
+        """index_of agrees with the position of every field."""
+        form_state = FormState()
+
+        for idx, field in enumerate(form_state.fields):
+            assert form_state.index_of(field.field_id) == idx
+        assert form_state.index_of("nonexistent_field") is None
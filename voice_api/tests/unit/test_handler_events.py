@@ -1,7 +1,7 @@
 """Test that handlers emit correct events for UI synchronization."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from google.genai import types
 
 from voice_api.app.state import FormState
@@ -9,72 +9,67 @@ from voice_api.llm.handlers import handle_tool_calls
 from voice_api.api.events import FormEvent
 
 
-@pytest.mark.asyncio
-async def test_save_form_field_emits_event():
-    """save_form_field should emit field_saved event."""
-    # Setup
-    form_state = FormState()
+@pytest.fixture
+def session_mock():
+    """Live session stand-in that records send_tool_response calls."""
     session = MagicMock()
-    session.send_tool_response = MagicMock()
-    
-    # Mock event_emitter
-    with patch("voice_api.llm.handlers.event_emitter") as mock_emitter:
-        # Create tool call
-        tool_call = types.ToolCall(
-            function_calls=[
-                types.FunctionCall(
-                    name="save_form_field",
-                    args={"value": "Mueller"}, 
-                    id="call_123"
-                )
-            ]
-        )
-        
-        # Test
-        await handle_tool_calls(tool_call, session, form_state)
-        
-        # Verify
-        assert mock_emitter.emit_sync.called
-        event = mock_emitter.emit_sync.call_args[0][0]
-        assert isinstance(event, FormEvent)
-        assert event.type == "field_saved"
-        assert event.data["field_id"] == "family_name_p1"
-        assert event.data["value"] == "Mueller"
+    session.send_tool_response = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def mock_emitter():
+    """Patch the handlers' event emitter for the duration of a test."""
+    with patch("voice_api.llm.handlers.event_emitter") as emitter:
+        yield emitter
+
+
+def _tool_call(name, args, call_id="call_1"):
+    """Wrap a single function call the way the live session delivers it."""
+    return types.LiveServerToolCall(
+        function_calls=[types.FunctionCall(name=name, args=args, id=call_id)]
+    )
 
 
 @pytest.mark.asyncio
-async def test_update_previous_field_emits_event():
-    """update_previous_field should emit field_updated event."""
+@pytest.mark.parametrize(
+    "name,args,prefilled,event_type,value",
+    [
+        pytest.param(
+            "save_form_field",
+            {"value": "Mueller"},
+            False,
+            "field_saved",
+            "Mueller",
+            id="save_form_field",
+        ),
+        pytest.param(
+            "update_previous_field",
+            {"field_id": "family_name_p1", "value": "NewValue"},
+            True,
+            "field_updated",
+            "NewValue",
+            id="update_previous_field",
+        ),
+    ],
+)
+async def test_handler_emits_event(
+    name, args, prefilled, event_type, value, session_mock, mock_emitter
+):
+    """Field-changing handlers should emit the matching UI event."""
     # Setup
     form_state = FormState()
-    # Pre-fill a field
-    field_id = "family_name_p1"
-    form_state.record_value(field_id, "OldValue")
-    form_state.advance()
-    
-    session = MagicMock()
-    session.send_tool_response = MagicMock()
-    
-    # Mock event_emitter
-    with patch("voice_api.llm.handlers.event_emitter") as mock_emitter:
-        # Create tool call
-        tool_call = types.ToolCall(
-            function_calls=[
-                types.FunctionCall(
-                    name="update_previous_field",
-                    args={"field_id": field_id, "value": "NewValue"},
-                    id="call_456"
-                )
-            ]
-        )
-        
-        # Test
-        await handle_tool_calls(tool_call, session, form_state)
-        
-        # Verify
-        assert mock_emitter.emit_sync.called
-        event = mock_emitter.emit_sync.call_args[0][0]
-        assert isinstance(event, FormEvent)
-        assert event.type == "field_updated"
-        assert event.data["field_id"] == field_id
-        assert event.data["value"] == "NewValue"
+    if prefilled:
+        form_state.record_value("family_name_p1", "OldValue")
+        form_state.advance()
+
+    # Test
+    await handle_tool_calls(_tool_call(name, args), session_mock, form_state)
+
+    # Verify
+    assert mock_emitter.emit_sync.called
+    event = mock_emitter.emit_sync.call_args[0][0]
+    assert isinstance(event, FormEvent)
+    assert event.type == event_type
+    assert event.data["field_id"] == "family_name_p1"
+    assert event.data["value"] == value
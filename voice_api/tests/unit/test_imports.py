@@ -0,0 +1,26 @@
+"""Tests for package import cost."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+class TestImportCost:
+    """Importing the app layer must not load the PDF stack."""
+
+    def test_validation_import_does_not_load_pypdfform(self):
+        """PyPDFForm should only be imported when a PDF is generated."""
+        # voice_api.app imports the audio pipeline, which needs pyaudio
+        pytest.importorskip("pyaudio")
+        # Fresh interpreter: this test session may already have imported PyPDFForm
+        code = "import sys, voice_api.app.validation; print('PyPDFForm' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).resolve().parents[3],
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
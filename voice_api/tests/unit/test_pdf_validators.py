@@ -8,178 +8,114 @@ from voice_api.core import validators
 class TestValidateText:
     """Tests for _validate_text validator."""
 
-    def test_valid_text(self):
-        """Non-empty text should validate."""
-        is_valid, msg = validators._validate_text("Mueller")
-        assert is_valid is True
-        assert msg == ""
-
-    def test_text_with_spaces(self):
-        """Text with spaces should validate."""
-        is_valid, msg = validators._validate_text("von Gräfenberg")
-        assert is_valid is True
-
-    def test_empty_text(self):
-        """Empty text should fail."""
-        is_valid, msg = validators._validate_text("")
-        assert is_valid is False
-        assert "empty" in msg.lower()
-
-    def test_whitespace_only(self):
-        """Whitespace-only text should fail."""
-        is_valid, msg = validators._validate_text("   ")
-        assert is_valid is False
+    @pytest.mark.parametrize(
+        "value,expected_valid,expected_substr",
+        [
+            pytest.param("Mueller", True, "", id="valid"),
+            pytest.param("von Gräfenberg", True, "", id="with_spaces"),
+            pytest.param("", False, "empty", id="empty"),
+            pytest.param("   ", False, "", id="whitespace_only"),
+        ],
+    )
+    def test_validate_text(self, value, expected_valid, expected_substr):
+        """Non-empty text should validate; empty or blank text should fail."""
+        is_valid, msg = validators._validate_text(value)
+        assert is_valid is expected_valid
+        if expected_valid:
+            assert msg == ""
+        assert expected_substr in msg.lower()
 
 
 class TestValidateDateDe:
     """Tests for _validate_date_de validator."""
 
-    def test_valid_full_year(self):
-        """Valid date in DDMMYYYY format should pass."""
-        is_valid, msg = validators._validate_date_de("15011990")
-        assert is_valid is True
-
-    def test_valid_two_digit_year_20xx(self):
-        """Two-digit year should be full 4-digit year."""
-        is_valid, msg = validators._validate_date_de("15012025")
-        assert is_valid is True
-
-    def test_valid_two_digit_year_19xx(self):
-        """Year in 1900s format."""
-        is_valid, msg = validators._validate_date_de("15011985")
-        assert is_valid is True
-
-    def test_invalid_format_no_dots(self):
-        """Date with dots should fail (requires DDMMYYYY format)."""
-        is_valid, msg = validators._validate_date_de("15.01.1990")
-        assert is_valid is False
-
-    def test_invalid_day(self):
-        """Invalid day (32) should fail."""
-        is_valid, msg = validators._validate_date_de("32011990")
-        assert is_valid is False
-
-    def test_invalid_month(self):
-        """Invalid month (13) should fail."""
-        is_valid, msg = validators._validate_date_de("15131990")
-        assert is_valid is False
-
-    def test_empty_date(self):
-        """Empty date should fail."""
-        is_valid, msg = validators._validate_date_de("")
-        assert is_valid is False
+    @pytest.mark.parametrize(
+        "value,expected_valid",
+        [
+            pytest.param("15011990", True, id="valid_full_year"),
+            pytest.param("15012025", True, id="valid_20xx"),
+            pytest.param("15011985", True, id="valid_19xx"),
+            pytest.param("15.01.1990", False, id="dots_not_allowed"),
+            pytest.param("32011990", False, id="invalid_day"),
+            pytest.param("15131990", False, id="invalid_month"),
+            pytest.param("", False, id="empty"),
+            pytest.param("\u0661\u0665\u0660\u0661\u0661\u0669\u0669\u0660", False, id="non_ascii_digits"),
+        ],
+    )
+    def test_validate_date_de(self, value, expected_valid):
+        """Only real dates in DDMMYYYY format should pass."""
+        is_valid, msg = validators._validate_date_de(value)
+        assert is_valid is expected_valid
 
 
 class TestValidateIntegerChoice:
     """Tests for _validate_integer_choice validator."""
 
-    def test_valid_within_range(self):
-        """Integer within range should pass."""
-        is_valid, msg = validators._validate_integer_choice("1", 0, 3)
-        assert is_valid is True
-
-    def test_valid_at_min(self):
-        """Integer at minimum should pass."""
-        is_valid, msg = validators._validate_integer_choice("0", 0, 3)
-        assert is_valid is True
-
-    def test_valid_at_max(self):
-        """Integer at maximum should pass."""
-        is_valid, msg = validators._validate_integer_choice("3", 0, 3)
-        assert is_valid is True
-
-    def test_below_min(self):
-        """Integer below min should fail."""
-        is_valid, msg = validators._validate_integer_choice("-1", 0, 3)
-        assert is_valid is False
-        assert "too small" in msg.lower()
-
-    def test_above_max(self):
-        """Integer above max should fail."""
-        is_valid, msg = validators._validate_integer_choice("5", 0, 3)
-        assert is_valid is False
-        assert "too large" in msg.lower()
-
-    def test_non_integer(self):
-        """Non-integer should fail."""
-        is_valid, msg = validators._validate_integer_choice("abc", 0, 3)
-        assert is_valid is False
-        assert "whole number" in msg.lower()
-
-    def test_empty_value(self):
-        """Empty value should fail."""
-        is_valid, msg = validators._validate_integer_choice("", 0, 3)
-        assert is_valid is False
-
-    def test_no_max_constraint(self):
-        """Large integer with no max should pass."""
-        is_valid, msg = validators._validate_integer_choice("999", 0, None)
-        assert is_valid is True
+    @pytest.mark.parametrize(
+        "value,min_val,max_val,expected_valid,expected_substr",
+        [
+            pytest.param("1", 0, 3, True, "", id="within_range"),
+            pytest.param("0", 0, 3, True, "", id="at_min"),
+            pytest.param("3", 0, 3, True, "", id="at_max"),
+            pytest.param("-1", 0, 3, False, "too small", id="below_min"),
+            pytest.param("5", 0, 3, False, "too large", id="above_max"),
+            pytest.param("abc", 0, 3, False, "whole number", id="non_integer"),
+            pytest.param("", 0, 3, False, "", id="empty"),
+            pytest.param("999", 0, None, True, "", id="no_max_constraint"),
+        ],
+    )
+    def test_validate_integer_choice(self, value, min_val, max_val, expected_valid, expected_substr):
+        """Integers within [min, max] should pass; others fail with a reason."""
+        is_valid, msg = validators._validate_integer_choice(value, min_val, max_val)
+        assert is_valid is expected_valid
+        assert expected_substr in msg.lower()
 
 
 class TestValidatePostalCodeDe:
     """Tests for _validate_postal_code_de validator."""
 
-    def test_valid_five_digit_code(self):
-        """Valid 5-digit postal code should pass."""
-        is_valid, msg = validators._validate_postal_code_de("80802")
-        assert is_valid is True
-
-    def test_valid_four_digit_code(self):
-        """Valid 4-digit postal code should pass."""
-        is_valid, msg = validators._validate_postal_code_de("1015")
-        assert is_valid is True
-
-    def test_invalid_three_digit_code(self):
-        """3-digit postal code should fail."""
-        is_valid, msg = validators._validate_postal_code_de("808")
-        assert is_valid is False
-
-    def test_invalid_six_digit_code(self):
-        """6-digit postal code should fail."""
-        is_valid, msg = validators._validate_postal_code_de("808020")
-        assert is_valid is False
-
-    def test_non_numeric(self):
-        """Non-numeric postal code should fail."""
-        is_valid, msg = validators._validate_postal_code_de("8080a")
-        assert is_valid is False
-
-    def test_empty_code(self):
-        """Empty postal code should fail."""
-        is_valid, msg = validators._validate_postal_code_de("")
-        assert is_valid is False
+    @pytest.mark.parametrize(
+        "value,expected_valid",
+        [
+            pytest.param("80802", True, id="five_digits"),
+            pytest.param("1015", True, id="four_digits"),
+            pytest.param("808", False, id="three_digits"),
+            pytest.param("808020", False, id="six_digits"),
+            pytest.param("8080a", False, id="non_numeric"),
+            pytest.param("\u0661\u0662\u0663\u0664\u0665", False, id="non_ascii_digits"),
+            pytest.param("", False, id="empty"),
+        ],
+    )
+    def test_validate_postal_code_de(self, value, expected_valid):
+        """Only 4- or 5-digit postal codes should pass."""
+        is_valid, msg = validators._validate_postal_code_de(value)
+        assert is_valid is expected_valid
 
 
 class TestValidateByType:
     """Tests for validate_by_type dispatch function."""
 
-    def test_dispatch_text(self):
-        """Dispatch to text validator."""
-        is_valid, msg = validators.validate_by_type("text", "Mueller")
-        assert is_valid is True
-
-    def test_dispatch_date_de(self):
-        """Dispatch to German date validator."""
-        is_valid, msg = validators.validate_by_type("date_de", "15011990")
-        assert is_valid is True
-
-    def test_dispatch_postal_code_de(self):
-        """Dispatch to German postal code validator."""
-        is_valid, msg = validators.validate_by_type("postal_code_de", "80802")
-        assert is_valid is True
-
-    def test_dispatch_integer_choice(self):
-        """Dispatch to integer choice validator with config."""
-        is_valid, msg = validators.validate_by_type(
-            "integer_choice", "2", {"min": 0, "max": 3}
-        )
-        assert is_valid is True
-
-    def test_unknown_validator_type(self):
-        """Unknown validator type should pass through."""
-        is_valid, msg = validators.validate_by_type(
-            "unknown_type", "anything"
-        )
-        assert is_valid is True
-        assert msg == ""
+    @pytest.mark.parametrize(
+        "validator_type,value,config,expected_valid",
+        [
+            pytest.param("text", "Mueller", None, True, id="text"),
+            pytest.param("text", "   ", None, False, id="text_blank"),
+            pytest.param("date_de", "15011990", None, True, id="date_de"),
+            pytest.param("date_de", "Mueller", None, False, id="date_de_non_numeric"),
+            pytest.param("postal_code_de", "80802", None, True, id="postal_code_de"),
+            pytest.param("postal_code_de", "Mueller", None, False, id="postal_code_de_non_numeric"),
+            pytest.param(
+                "integer_choice", "2", {"min": 0, "max": 3}, True, id="integer_choice"
+            ),
+            pytest.param(
+                "integer_choice", "Mueller", {"min": 0, "max": 3}, False,
+                id="integer_choice_non_numeric",
+            ),
+            pytest.param("unknown_type", "anything", None, True, id="unknown_type"),
+        ],
+    )
+    def test_dispatch(self, validator_type, value, config, expected_valid):
+        """Dispatch routes each validator type to its validator."""
+        is_valid, msg = validators.validate_by_type(validator_type, value, config)
+        assert is_valid is expected_valid
+        assert (msg == "") is expected_valid
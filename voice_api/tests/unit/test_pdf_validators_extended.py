@@ -1,5 +1,8 @@
 """Extended tests for voice_api.core.validators module."""
 
+import itertools
+import re
+
 import pytest
 from datetime import datetime
 from voice_api.core.validators import (
@@ -10,296 +13,187 @@ from voice_api.core.validators import (
     validate_by_type,
 )
 
+# Maps ASCII 0-9 to the Arabic-Indic digits, which str.isdecimal() also accepts
+_ARABIC_INDIC_DIGITS = str.maketrans("0123456789", "".join(chr(0x660 + d) for d in range(10)))
+
 
 class TestValidateTextEdgeCases:
     """Edge cases for text validation."""
 
-    def test_validate_text_with_spaces(self):
-        """Text with only spaces should be invalid."""
-        result, message = _validate_text("   ")
-        assert not result
-
-    def test_validate_text_with_special_characters(self):
-        """Text with special characters should be valid."""
-        result, message = _validate_text("Mueller-Schmidt")
-        assert result
-
-    def test_validate_text_with_umlauts(self):
-        """German umlauts should be valid."""
-        result, message = _validate_text("Müller")
-        assert result
-
-    def test_validate_text_single_character(self):
-        """Single character should be valid."""
-        result, message = _validate_text("A")
-        assert result
-
-    def test_validate_text_very_long(self):
-        """Very long text should be valid."""
-        result, message = _validate_text("A" * 1000)
-        assert result
-
-    def test_validate_text_with_numbers(self):
-        """Numbers in text should be valid."""
-        result, message = _validate_text("Test123")
-        assert result
-
-    def test_validate_text_with_punctuation(self):
-        """Punctuation should be valid."""
-        result, message = _validate_text("Dr. med. Mueller")
-        assert result
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            pytest.param("   ", False, id="spaces_only"),
+            pytest.param("Mueller-Schmidt", True, id="special_characters"),
+            pytest.param("Müller", True, id="umlauts"),
+            pytest.param("A", True, id="single_character"),
+            pytest.param("A" * 1000, True, id="very_long"),
+            pytest.param("Test123", True, id="with_numbers"),
+            pytest.param("Dr. med. Mueller", True, id="with_punctuation"),
+        ],
+    )
+    def test_validate_text(self, value, expected):
+        """Any non-blank text is valid; whitespace-only text is not."""
+        result, message = _validate_text(value)
+        assert result is expected
 
 
 class TestValidateDateDEEdgeCases:
     """Edge cases for German date validation."""
 
-    def test_validate_date_leap_year(self):
-        """Valid leap year date should pass."""
-        result, message = _validate_date_de("29022020")
-        assert result
-
-    def test_validate_date_non_leap_year_feb_29(self):
-        """Feb 29 in non-leap year should fail."""
-        result, message = _validate_date_de("29022021")
-        assert not result
-
-    def test_validate_date_year_99_treated_as_1999(self):
-        """Year must be full 4 digits."""
-        result, message = _validate_date_de("01011999")
-        assert result
-
-    def test_validate_date_year_00_treated_as_2000(self):
-        """Year 2000 valid."""
-        result, message = _validate_date_de("01012000")
-        assert result
-
-    def test_validate_date_year_30_treated_as_1930(self):
-        """Year 1930 valid."""
-        result, message = _validate_date_de("01011930")
-        assert result
-
-    def test_validate_date_year_31_treated_as_2031(self):
-        """Year 2031 valid."""
-        result, message = _validate_date_de("01012031")
-        assert result
-
-    def test_validate_date_invalid_day_32(self):
-        """Day 32 should be invalid."""
-        result, message = _validate_date_de("32011990")
-        assert not result
-
-    def test_validate_date_invalid_month_13(self):
-        """Month 13 should be invalid."""
-        result, message = _validate_date_de("01131990")
-        assert not result
-
-    def test_validate_date_invalid_format_with_slashes(self):
-        """Slashes should be invalid (requires DDMMYYYY format)."""
-        result, message = _validate_date_de("01/01/1990")
-        assert not result
-
-    def test_validate_date_invalid_format_no_separators(self):
-        """Wrong length should be invalid (must be exactly 8 digits)."""
-        result, message = _validate_date_de("01011990extra")
-        assert not result
-
-    def test_validate_date_padding_not_required(self):
-        """Dates must have exactly 8 digits (zero-padded)."""
-        result, message = _validate_date_de("1.1.1990")
-        # Should fail - needs 8 digits
-        assert not result
-
-    def test_validate_date_december_31st(self):
-        """Dec 31 should be valid."""
-        result, message = _validate_date_de("31121990")
-        assert result
-
-    def test_validate_date_january_1st(self):
-        """Jan 1 should be valid."""
-        result, message = _validate_date_de("01011990")
-        assert result
-
-    def test_validate_date_april_31_invalid(self):
-        """April 31 doesn't exist."""
-        result, message = _validate_date_de("31041990")
-        assert not result
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            pytest.param("29022020", True, id="leap_year"),
+            pytest.param("29022021", False, id="non_leap_year_feb_29"),
+            pytest.param("29022000", True, id="century_leap_year"),
+            pytest.param("29021900", False, id="century_non_leap_year"),
+            pytest.param("01010000", False, id="year_zero"),
+            pytest.param("01011999", True, id="year_1999"),
+            pytest.param("01012000", True, id="year_2000"),
+            pytest.param("01011930", True, id="year_1930"),
+            pytest.param("01012031", True, id="year_2031"),
+            pytest.param("32011990", False, id="day_32"),
+            pytest.param("01131990", False, id="month_13"),
+            pytest.param("01/01/1990", False, id="slashes"),
+            pytest.param("01011990extra", False, id="too_long"),
+            pytest.param("1.1.1990", False, id="not_zero_padded"),
+            pytest.param("31121990", True, id="december_31st"),
+            pytest.param("01011990", True, id="january_1st"),
+            pytest.param("31041990", False, id="april_31"),
+        ],
+    )
+    def test_validate_date(self, value, expected):
+        """Only real calendar dates written as exactly 8 digits DDMMYYYY pass."""
+        result, message = _validate_date_de(value)
+        assert result is expected
+
+    @pytest.mark.parametrize("year", [1900, 1999, 2000, 2020, 2021, 2100])
+    def test_validate_date_matches_stdlib(self, year):
+        """Every day/month combination agrees with datetime's calendar rules."""
+        for month in range(0, 14):
+            for day in range(0, 33):
+                try:
+                    datetime(year, month, day)
+                    expected = True
+                except ValueError:
+                    expected = False
+                value = f"{day:02d}{month:02d}{year:04d}"
+                result, message = _validate_date_de(value)
+                assert result is expected, (day, month, year)
+                # The same date in non-ASCII (Arabic-Indic) digits is never accepted
+                result, message = _validate_date_de(value.translate(_ARABIC_INDIC_DIGITS))
+                assert result is False, (day, month, year)
 
 
 class TestValidateIntegerChoiceEdgeCases:
     """Edge cases for integer choice validation."""
 
-    def test_validate_choice_at_min_boundary(self):
-        """Value at minimum should be valid."""
-        result, message = _validate_integer_choice("0", min_val=0, max_val=5)
-        assert result
-
-    def test_validate_choice_at_max_boundary(self):
-        """Value at maximum should be valid."""
-        result, message = _validate_integer_choice("5", min_val=0, max_val=5)
-        assert result
-
-    def test_validate_choice_below_min(self):
-        """Value below minimum should be invalid."""
-        result, message = _validate_integer_choice("-1", min_val=0, max_val=5)
-        assert not result
-
-    def test_validate_choice_above_max(self):
-        """Value above maximum should be invalid."""
-        result, message = _validate_integer_choice("6", min_val=0, max_val=5)
-        assert not result
-
-    def test_validate_choice_single_value_range(self):
-        """Single value range (min==max) should work."""
-        result, message = _validate_integer_choice("3", min_val=3, max_val=3)
-        assert result
-
-    def test_validate_choice_non_integer(self):
-        """Non-integer strings should be invalid."""
-        result, message = _validate_integer_choice("abc", min_val=0, max_val=5)
-        assert not result
-
-    def test_validate_choice_float(self):
-        """Float values should be invalid."""
-        result, message = _validate_integer_choice("3.5", min_val=0, max_val=5)
-        assert not result
-
-    def test_validate_choice_leading_zeros(self):
-        """Leading zeros might be accepted."""
-        result, message = _validate_integer_choice("03", min_val=0, max_val=5)
-        assert result
-
-    def test_validate_choice_negative_range(self):
-        """Negative ranges should work."""
-        result, message = _validate_integer_choice("-5", min_val=-10, max_val=-1)
-        assert result
-
-    def test_validate_choice_large_numbers(self):
-        """Large numbers should work."""
-        result, message = _validate_integer_choice("1000000", min_val=0, max_val=2000000)
-        assert result
+    @pytest.mark.parametrize(
+        "value,min_val,max_val,expected",
+        [
+            pytest.param("0", 0, 5, True, id="at_min_boundary"),
+            pytest.param("5", 0, 5, True, id="at_max_boundary"),
+            pytest.param("-1", 0, 5, False, id="below_min"),
+            pytest.param("6", 0, 5, False, id="above_max"),
+            pytest.param("3", 3, 3, True, id="single_value_range"),
+            pytest.param("abc", 0, 5, False, id="non_integer"),
+            pytest.param("3.5", 0, 5, False, id="float"),
+            pytest.param("03", 0, 5, True, id="leading_zeros"),
+            pytest.param("-5", -10, -1, True, id="negative_range"),
+            pytest.param("1000000", 0, 2000000, True, id="large_numbers"),
+        ],
+    )
+    def test_validate_choice(self, value, min_val, max_val, expected):
+        """Whole numbers within [min_val, max_val] pass."""
+        result, message = _validate_integer_choice(value, min_val=min_val, max_val=max_val)
+        assert result is expected
+
+    def test_validate_choice_matches_bounds(self):
+        """Across a grid of ranges, a value passes exactly when min_val <= value <= max_val."""
+        for min_val in range(-3, 4):
+            for max_val in range(min_val, min_val + 4):
+                for num in range(-8, 9):
+                    result, message = _validate_integer_choice(
+                        str(num), min_val=min_val, max_val=max_val
+                    )
+                    assert result is (min_val <= num <= max_val), (num, min_val, max_val)
 
 
 class TestValidatePostalCodeDEEdgeCases:
     """Edge cases for German postal code validation."""
 
-    def test_validate_postal_valid_5_digit(self):
-        """5-digit postal codes should be valid."""
-        result, message = _validate_postal_code_de("10115")
-        assert result
-
-    def test_validate_postal_valid_4_digit(self):
-        """4-digit postal codes should be valid."""
-        result, message = _validate_postal_code_de("1234")
-        assert result
-
-    def test_validate_postal_with_leading_zero(self):
-        """Postal codes with leading zero should be valid."""
-        result, message = _validate_postal_code_de("01234")
-        assert result
-
-    def test_validate_postal_too_short_3_digits(self):
-        """3-digit codes should be invalid."""
-        result, message = _validate_postal_code_de("123")
-        assert not result
-
-    def test_validate_postal_too_long_6_digits(self):
-        """6-digit codes should be invalid."""
-        result, message = _validate_postal_code_de("123456")
-        assert not result
-
-    def test_validate_postal_with_spaces(self):
-        """Postal codes with spaces should be invalid."""
-        result, message = _validate_postal_code_de("10 115")
-        assert not result
-
-    def test_validate_postal_with_hyphens(self):
-        """Postal codes with hyphens should be invalid."""
-        result, message = _validate_postal_code_de("10-115")
-        assert not result
-
-    def test_validate_postal_with_letters(self):
-        """Postal codes with letters should be invalid."""
-        result, message = _validate_postal_code_de("1011A")
-        assert not result
-
-    def test_validate_postal_all_zeros(self):
-        """All zeros might be invalid depending on rules."""
-        result, message = _validate_postal_code_de("00000")
-        # Just check it doesn't crash
-        assert result is not None
-
-    def test_validate_postal_empty_string(self):
-        """Empty string should be invalid."""
-        result, message = _validate_postal_code_de("")
-        assert not result
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            pytest.param("10115", True, id="valid_5_digit"),
+            pytest.param("1234", True, id="valid_4_digit"),
+            pytest.param("01234", True, id="leading_zero"),
+            pytest.param("123", False, id="too_short_3_digits"),
+            pytest.param("123456", False, id="too_long_6_digits"),
+            pytest.param("10 115", False, id="with_spaces"),
+            pytest.param("10-115", False, id="with_hyphens"),
+            pytest.param("1011A", False, id="with_letters"),
+            pytest.param("00000", True, id="all_zeros"),
+            pytest.param("", False, id="empty_string"),
+        ],
+    )
+    def test_validate_postal(self, value, expected):
+        """Only 4 or 5 ASCII digits pass."""
+        result, message = _validate_postal_code_de(value)
+        assert result is expected
+
+    def test_validate_postal_matches_pattern(self):
+        """Every short string over a mixed alphabet passes exactly when it is 4-5 ASCII digits."""
+        # ASCII digits, a letter, whitespace and a non-ASCII decimal digit
+        alphabet = ("0", "9", "a", " ", "\u0661")
+        for length in range(7):
+            for chars in itertools.product(alphabet, repeat=length):
+                value = "".join(chars)
+                expected = re.fullmatch(r"[0-9]{4,5}", value.strip()) is not None
+                result, message = _validate_postal_code_de(value)
+                assert result is expected, repr(value)
 
 
 class TestValidateByType:
     """Test dispatcher function."""
 
-    def test_validate_by_type_text(self):
-        """Dispatcher should route to text validator."""
-        result, message = validate_by_type("text", "TestValue")
-        assert result
-
-    def test_validate_by_type_text_empty(self):
-        """Dispatcher should reject empty text."""
-        result, message = validate_by_type("text", "")
-        assert not result
-
-    def test_validate_by_type_date_de_valid(self):
-        """Dispatcher should route to date validator."""
-        result, message = validate_by_type("date_de", "01011990")
-        assert result
-
-    def test_validate_by_type_date_de_invalid(self):
-        """Dispatcher should reject invalid date."""
-        result, message = validate_by_type("date_de", "99991990")
-        assert not result
-
-    def test_validate_by_type_integer_choice(self):
-        """Dispatcher should route to choice validator."""
-        # Would need to pass min/max somehow
-        result, message = validate_by_type("integer_choice", "2")
-        # Just check it doesn't crash
-        assert result is not None
-
-    def test_validate_by_type_postal_code_de(self):
-        """Dispatcher should route to postal code validator."""
-        result, message = validate_by_type("postal_code_de", "10115")
-        assert result
-
-    def test_validate_by_type_unknown_type(self):
-        """Unknown type should be handled."""
-        result, message = validate_by_type("unknown_type", "value")
-        # Should either reject or provide default behavior
-        assert result is not None
+    @pytest.mark.parametrize(
+        "validator_type,value,expected",
+        [
+            pytest.param("text", "TestValue", True, id="text"),
+            pytest.param("text", "", False, id="text_empty"),
+            pytest.param("date_de", "01011990", True, id="date_de_valid"),
+            pytest.param("date_de", "99991990", False, id="date_de_invalid"),
+            # No config: min defaults to 0 and there is no max
+            pytest.param("integer_choice", "2", True, id="integer_choice"),
+            pytest.param("postal_code_de", "10115", True, id="postal_code_de"),
+            # Unknown types pass through as valid
+            pytest.param("unknown_type", "value", True, id="unknown_type"),
+        ],
+    )
+    def test_validate_by_type(self, validator_type, value, expected):
+        """Dispatcher should route each type to its validator."""
+        result, message = validate_by_type(validator_type, value)
+        assert result is expected
 
 
 class TestValidatorErrorMessages:
     """Test error message quality."""
 
-    def test_text_error_message_not_empty(self):
+    @pytest.mark.parametrize(
+        "validator,args",
+        [
+            pytest.param(_validate_text, ("",), id="text"),
+            pytest.param(_validate_date_de, ("99.99.1990",), id="date"),
+            pytest.param(_validate_integer_choice, ("100", 0, 5), id="choice"),
+            pytest.param(_validate_postal_code_de, ("123",), id="postal"),
+        ],
+    )
+    def test_error_message_not_empty(self, validator, args):
         """Error messages should be informative."""
-        result, message = _validate_text("")
-        assert message is not None
-        assert len(message) > 0
-
-    def test_date_error_message_not_empty(self):
-        """Date error messages should be informative."""
-        result, message = _validate_date_de("99.99.1990")
-        assert message is not None
-        assert len(message) > 0
-
-    def test_choice_error_message_not_empty(self):
-        """Choice error messages should be informative."""
-        result, message = _validate_integer_choice("100", min_val=0, max_val=5)
-        assert message is not None
-        assert len(message) > 0
-
-    def test_postal_error_message_not_empty(self):
-        """Postal code error messages should be informative."""
-        result, message = _validate_postal_code_de("123")
+        result, message = validator(*args)
+        assert not result
         assert message is not None
         assert len(message) > 0
 
@@ -307,44 +201,47 @@ class TestValidatorErrorMessages:
 class TestValidatorWithNoneValues:
     """Test validators with None inputs."""
 
-    def test_text_validator_with_none(self):
-        """Text validator should handle None gracefully."""
+    @pytest.mark.parametrize(
+        "validator",
+        [
+            pytest.param(_validate_text, id="text"),
+            pytest.param(_validate_date_de, id="date"),
+        ],
+    )
+    def test_validator_with_none(self, validator):
+        """Validators should handle None gracefully."""
         try:
-            result, message = _validate_text(None)
+            result, message = validator(None)
             # If it doesn't crash, check result is False
             assert not result
         except (TypeError, AttributeError):
             # Acceptable to raise TypeError for None
             pass
 
-    def test_date_validator_with_none(self):
-        """Date validator should handle None gracefully."""
-        try:
-            result, message = _validate_date_de(None)
-            assert not result
-        except (TypeError, AttributeError):
-            pass
-
 
 class TestValidatorConsistency:
     """Test consistency of validators."""
 
-    def test_same_input_produces_same_result(self):
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("Test", id="word"),
+            pytest.param("Valid Name", id="two_words"),
+            pytest.param("Müller", id="umlaut"),
+            pytest.param("", id="empty"),
+            pytest.param(" \t\n", id="whitespace"),
+        ],
+    )
+    def test_same_input_produces_same_result(self, value):
         """Validators should be deterministic."""
-        result1, msg1 = _validate_text("Test")
-        result2, msg2 = _validate_text("Test")
-        
-        assert result1 == result2
-        assert msg1 == msg2
+        assert _validate_text(value) == _validate_text(value)
 
     def test_valid_input_always_valid(self):
         """Consistently valid inputs should always be valid."""
-        for _ in range(5):
-            result, message = _validate_text("Valid Name")
-            assert result
+        result, message = _validate_text("Valid Name")
+        assert result
 
     def test_invalid_input_always_invalid(self):
         """Consistently invalid inputs should always be invalid."""
-        for _ in range(5):
-            result, message = _validate_text("")
-            assert not result
+        result, message = _validate_text("")
+        assert not result
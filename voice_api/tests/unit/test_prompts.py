@@ -1,35 +1,58 @@
 """Unit tests for prompts module."""
 
+import pytest
+
 from voice_api.core import ANMELDUNG_FORM_FIELDS
 from voice_api.llm import build_system_prompt
 
+_LABELS = tuple(f.label for f in ANMELDUNG_FORM_FIELDS)
+_DESCRIPTIONS = tuple(f.description for f in ANMELDUNG_FORM_FIELDS)
+
 
 class TestBuildSystemPrompt:
     """Test system prompt building."""
 
-    def test_system_prompt_is_string(self):
+    def test_system_prompt_is_string(self, system_prompt):
         """build_system_prompt should return a string."""
-        prompt = build_system_prompt()
-        assert isinstance(prompt, str)
-        assert len(prompt) > 0
+        assert isinstance(system_prompt, str)
+        assert len(system_prompt) > 0
 
-    def test_system_prompt_includes_all_field_labels(self):
+    def test_system_prompt_includes_all_field_labels(self, system_prompt):
         """System prompt should include all form field labels for field discovery."""
-        prompt = build_system_prompt()
-
-        for field in ANMELDUNG_FORM_FIELDS:
-            assert field.label in prompt, f"Field '{field.label}' not found in prompt"
+        missing = [label for label in _LABELS if label not in system_prompt]
+        assert not missing, f"Fields not found in prompt: {missing}"
 
-    def test_system_prompt_includes_all_field_descriptions(self):
+    def test_system_prompt_includes_all_field_descriptions(self, system_prompt):
         """System prompt should include field descriptions for user context."""
-        prompt = build_system_prompt()
-
-        for field in ANMELDUNG_FORM_FIELDS:
-            assert field.description in prompt, f"Description for '{field.label}' not found in prompt"
-
-    def test_system_prompt_includes_tool_names(self):
-        """System prompt should reference the main tools for interaction."""
-        prompt = build_system_prompt()
-        assert "get_next_form_field" in prompt
-        assert "validate_form_field" in prompt
-        assert "save_form_field" in prompt
+        missing = [desc for desc in _DESCRIPTIONS if desc not in system_prompt]
+        assert not missing, f"Descriptions not found in prompt: {missing}"
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "get_next_form_field",
+            "validate_form_field",
+            "save_form_field",
+            "get_all_answers",
+            "update_previous_field",
+            "generate_anmeldung_pdf",
+            "DDMMYYYY",
+        ],
+    )
+    def test_system_prompt_includes_tool_names(self, system_prompt, needle):
+        """System prompt should reference the tools and the date input format."""
+        assert needle in system_prompt
+
+    def test_system_prompt_is_cached(self):
+        """Repeated calls should return the same cached string."""
+        assert build_system_prompt() is build_system_prompt()
+
+    def test_invalidate_prompt_cache_rebuilds(self):
+        """After invalidation the prompt is rebuilt with identical content."""
+        from voice_api.llm.prompts import invalidate_prompt_cache
+
+        before = build_system_prompt()
+        invalidate_prompt_cache()
+        after = build_system_prompt()
+        assert after == before
+        assert after is not before
@@ -1,7 +1,20 @@
 """Unit tests for field definitions."""
 
+import pytest
+
 from voice_api.core import ANMELDUNG_FORM_FIELDS, FIELD_BY_ID, FIELD_BY_PDF_ID
 
+_FIELD_IDS = tuple(f.field_id for f in ANMELDUNG_FORM_FIELDS)
+_PDF_FIELD_IDS = tuple(f.pdf_field_id for f in ANMELDUNG_FORM_FIELDS)
+_VALIDATOR_TYPES = frozenset({"text", "date_de", "integer_choice", "postal_code_de"})
+_CHOICE_FIELDS = tuple(
+    f for f in ANMELDUNG_FORM_FIELDS if f.validator.type == "integer_choice"
+)
+
+
+def _field_id(field):
+    return field.field_id
+
 
 class TestAnmeldungFields:
     """Tests for field definitions."""
@@ -24,35 +37,28 @@ class TestAnmeldungFields:
 
     def test_unique_field_ids(self):
         """All field_ids should be unique."""
-        ids = [f.field_id for f in ANMELDUNG_FORM_FIELDS]
-        assert len(ids) == len(set(ids))
+        assert len(_FIELD_IDS) == len(set(_FIELD_IDS))
 
     def test_unique_pdf_field_ids(self):
         """All pdf_field_ids should be unique."""
-        pdf_ids = [f.pdf_field_id for f in ANMELDUNG_FORM_FIELDS]
-        assert len(pdf_ids) == len(set(pdf_ids))
+        assert len(_PDF_FIELD_IDS) == len(set(_PDF_FIELD_IDS))
+
+    def test_lookup_maps_cover_all_fields(self):
+        """FIELD_BY_ID and FIELD_BY_PDF_ID should have one entry per field."""
+        assert len(FIELD_BY_ID) == len(_FIELD_IDS)
+        assert len(FIELD_BY_PDF_ID) == len(_PDF_FIELD_IDS)
 
-    def test_all_fields_have_validator(self):
+    @pytest.mark.parametrize("field", ANMELDUNG_FORM_FIELDS, ids=_field_id)
+    def test_all_fields_have_validator(self, field):
         """All fields should have a validator."""
-        for field in ANMELDUNG_FORM_FIELDS:
-            assert field.validator is not None
-            assert field.validator.type in [
-                "text",
-                "date_de",
-                "integer_choice",
-                "postal_code_de",
-            ]
-
-    def test_choice_fields_have_enum_values(self):
+        assert field.validator is not None
+        assert field.validator.type in _VALIDATOR_TYPES
+
+    @pytest.mark.parametrize("field", _CHOICE_FIELDS, ids=_field_id)
+    def test_choice_fields_have_enum_values(self, field):
         """Choice fields should have enum_values."""
-        choice_fields = [
-            f
-            for f in ANMELDUNG_FORM_FIELDS
-            if f.validator.type == "integer_choice"
-        ]
-        for field in choice_fields:
-            assert field.enum_values is not None
-            assert len(field.enum_values) > 0
+        assert field.enum_values is not None
+        assert len(field.enum_values) > 0
 
     def test_field_validator_config(self):
         """Integer choice fields should have min/max config."""
@@ -61,8 +67,8 @@ class TestAnmeldungFields:
         assert "min" in gender_field.validator.config
         assert "max" in gender_field.validator.config
 
-    def test_all_fields_have_examples(self):
+    @pytest.mark.parametrize("field", ANMELDUNG_FORM_FIELDS, ids=_field_id)
+    def test_all_fields_have_examples(self, field):
         """All fields should have at least one example."""
-        for field in ANMELDUNG_FORM_FIELDS:
-            assert field.examples is not None
-            assert len(field.examples) > 0
+        assert field.examples is not None
+        assert len(field.examples) > 0
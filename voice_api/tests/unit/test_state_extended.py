@@ -1,42 +1,41 @@
 """Extended unit tests for voice_api.app.state module."""
 
+import copy
+import pickle
+
 import pytest
-from voice_api.app import FormState
 from voice_api.core import ANMELDUNG_FORM_FIELDS
 
+_LONG_VALUE = "A" * 10000
+
 
 class TestFormStateBasics:
     """Test FormState basic functionality."""
 
-    def test_form_state_initialization(self):
+    def test_form_state_initialization(self, form_state):
         """FormState should initialize with correct defaults."""
-        form_state = FormState()
-
         assert form_state.current_index == 0
         assert len(form_state.answers) == 0
         assert len(form_state.validation_errors) == 0
         assert len(form_state.fields) > 0
 
-    def test_current_field_at_start(self):
+    def test_current_field_at_start(self, form_state):
         """current_field returns first field at start."""
-        form_state = FormState()
         field = form_state.current_field()
 
         assert field is not None
         assert field == form_state.fields[0]
 
-    def test_advance_increments_index(self):
+    def test_advance_increments_index(self, form_state):
         """advance() increments current_index."""
-        form_state = FormState()
         initial_index = form_state.current_index
 
         form_state.advance()
 
         assert form_state.current_index == initial_index + 1
 
-    def test_current_field_progression(self):
+    def test_current_field_progression(self, form_state):
         """current_field changes as we advance."""
-        form_state = FormState()
         field1 = form_state.current_field()
 
         form_state.advance()
@@ -44,10 +43,8 @@ class TestFormStateBasics:
 
         assert field1 != field2
 
-    def test_current_field_at_end(self):
+    def test_current_field_at_end(self, form_state):
         """current_field returns None when at end."""
-        form_state = FormState()
-
         num_fields = len(form_state.fields)
         for _ in range(num_fields + 1):
             form_state.advance()
@@ -58,19 +55,35 @@ class TestFormStateBasics:
 class TestRecordValue:
     """Test record_value method."""
 
-    def test_record_value_stores_answer(self):
-        """record_value stores the value in answers dict."""
-        form_state = FormState()
-
-        form_state.record_value("test_field", "test_value")
-
-        assert "test_field" in form_state.answers
-        assert form_state.answers["test_field"] == "test_value"
-
-    def test_record_value_clears_error(self):
+    @pytest.mark.parametrize(
+        "writes,expected",
+        [
+            pytest.param(
+                [("test_field", "test_value")],
+                {"test_field": "test_value"},
+                id="stores_answer",
+            ),
+            pytest.param(
+                [("field1", "value1"), ("field2", "value2"), ("field3", "value3")],
+                {"field1": "value1", "field2": "value2", "field3": "value3"},
+                id="multiple_values",
+            ),
+            pytest.param(
+                [("field", "old_value"), ("field", "new_value")],
+                {"field": "new_value"},
+                id="overwrites",
+            ),
+        ],
+    )
+    def test_record_value(self, form_state, writes, expected):
+        """record_value stores answers by field_id; later writes win."""
+        for field_id, value in writes:
+            form_state.record_value(field_id, value)
+
+        assert form_state.answers == expected
+
+    def test_record_value_clears_error(self, form_state):
         """record_value removes error for that field."""
-        form_state = FormState()
-
         # Set an error
         form_state.set_error("test_field", "Test error")
         assert "test_field" in form_state.validation_errors
@@ -80,54 +93,26 @@ class TestRecordValue:
 
         assert "test_field" not in form_state.validation_errors
 
-    def test_record_multiple_values(self):
-        """Can record values for multiple fields."""
-        form_state = FormState()
-
-        form_state.record_value("field1", "value1")
-        form_state.record_value("field2", "value2")
-        form_state.record_value("field3", "value3")
-
-        assert len(form_state.answers) == 3
-        assert form_state.answers["field1"] == "value1"
-        assert form_state.answers["field2"] == "value2"
-        assert form_state.answers["field3"] == "value3"
-
-    def test_record_value_overwrites(self):
-        """Recording a new value overwrites the old one."""
-        form_state = FormState()
-
-        form_state.record_value("field", "old_value")
-        form_state.record_value("field", "new_value")
-
-        assert form_state.answers["field"] == "new_value"
-
 
 class TestSetError:
     """Test set_error method."""
 
-    def test_set_error_stores_error(self):
+    def test_set_error_stores_error(self, form_state):
         """set_error stores error in validation_errors."""
-        form_state = FormState()
-
         form_state.set_error("field", "Error message")
 
         assert "field" in form_state.validation_errors
         assert form_state.validation_errors["field"] == "Error message"
 
-    def test_set_error_overwrites(self):
+    def test_set_error_overwrites(self, form_state):
         """Setting a new error overwrites the old one."""
-        form_state = FormState()
-
         form_state.set_error("field", "Error 1")
         form_state.set_error("field", "Error 2")
 
         assert form_state.validation_errors["field"] == "Error 2"
 
-    def test_multiple_field_errors(self):
+    def test_multiple_field_errors(self, form_state):
         """Can track errors for multiple fields."""
-        form_state = FormState()
-
         form_state.set_error("field1", "Error 1")
         form_state.set_error("field2", "Error 2")
 
@@ -137,14 +122,12 @@ class TestSetError:
 class TestProgressTracking:
     """Test progress_percent method."""
 
-    def test_progress_initially_zero(self):
+    def test_progress_initially_zero(self, form_state):
         """Progress is 0% with no answers."""
-        form_state = FormState()
         assert form_state.progress_percent() == 0.0
 
-    def test_progress_increases_with_answers(self):
+    def test_progress_increases_with_answers(self, form_state):
         """Progress increases as answers are recorded."""
-        form_state = FormState()
         initial = form_state.progress_percent()
 
         field = form_state.current_field()
@@ -153,19 +136,15 @@ class TestProgressTracking:
         new_progress = form_state.progress_percent()
         assert new_progress > initial
 
-    def test_progress_reaches_100(self):
+    def test_progress_reaches_100(self, form_state):
         """Progress reaches 100% when all fields answered."""
-        form_state = FormState()
-
         for field in form_state.fields:
             form_state.record_value(field.field_id, "answer")
 
         assert form_state.progress_percent() == 100.0
 
-    def test_progress_bounded_at_100(self):
+    def test_progress_bounded_at_100(self, form_state):
         """Progress never exceeds 100%."""
-        form_state = FormState()
-
         # Record answers for all fields
         for field in form_state.fields:
             form_state.record_value(field.field_id, "answer")
@@ -176,10 +155,8 @@ class TestProgressTracking:
         progress = form_state.progress_percent()
         assert progress <= 100.0
 
-    def test_progress_is_percentage(self):
+    def test_progress_is_percentage(self, form_state):
         """Progress is between 0 and 100."""
-        form_state = FormState()
-
         # No answers
         assert 0 <= form_state.progress_percent() <= 100
 
@@ -197,25 +174,20 @@ class TestProgressTracking:
 class TestIsComplete:
     """Test is_complete method."""
 
-    def test_is_complete_false_at_start(self):
+    def test_is_complete_false_at_start(self, form_state):
         """is_complete is False initially."""
-        form_state = FormState()
         assert not form_state.is_complete()
 
-    def test_is_complete_true_after_advancing_past_end(self):
+    def test_is_complete_true_after_advancing_past_end(self, form_state):
         """is_complete is True after advancing past last field."""
-        form_state = FormState()
-
         num_fields = len(form_state.fields)
         for _ in range(num_fields):
             form_state.advance()
 
         assert form_state.is_complete()
 
-    def test_is_complete_false_on_last_field(self):
+    def test_is_complete_false_on_last_field(self, form_state):
         """is_complete is False on the last field."""
-        form_state = FormState()
-
         num_fields = len(form_state.fields)
         for _ in range(num_fields - 1):
             form_state.advance()
@@ -226,24 +198,20 @@ class TestIsComplete:
 class TestToPDFFormat:
     """Test to_pdf_format conversion."""
 
-    def test_to_pdf_format_returns_dict(self):
+    def test_to_pdf_format_returns_dict(self, form_state):
         """to_pdf_format returns a dictionary."""
-        form_state = FormState()
         pdf_format = form_state.to_pdf_format()
 
         assert isinstance(pdf_format, dict)
 
-    def test_to_pdf_format_empty_when_no_answers(self):
+    def test_to_pdf_format_empty_when_no_answers(self, form_state):
         """to_pdf_format returns empty dict with no answers."""
-        form_state = FormState()
         pdf_format = form_state.to_pdf_format()
 
         assert len(pdf_format) == 0
 
-    def test_to_pdf_format_with_answers(self):
+    def test_to_pdf_format_with_answers(self, form_state):
         """to_pdf_format converts recorded answers."""
-        form_state = FormState()
-
         form_state.record_value("family_name_p1", "Mueller")
         pdf_format = form_state.to_pdf_format()
 
@@ -256,10 +224,8 @@ class TestToPDFFormat:
 class TestFormStateEdgeCases:
     """Test edge cases."""
 
-    def test_advance_past_end(self):
+    def test_advance_past_end(self, form_state):
         """Can safely advance past the end of form."""
-        form_state = FormState()
-
         num_fields = len(form_state.fields)
         for _ in range(num_fields + 10):
             form_state.advance()
@@ -267,40 +233,33 @@ class TestFormStateEdgeCases:
         # Should remain complete
         assert form_state.is_complete()
 
-    def test_empty_string_answer(self):
+    def test_empty_string_answer(self, form_state):
         """Can record empty string as answer."""
-        form_state = FormState()
-
         form_state.record_value("field", "")
 
         assert "field" in form_state.answers
         assert form_state.answers["field"] == ""
 
-    def test_special_characters_in_value(self):
+    def test_special_characters_in_value(self, form_state):
         """Can record special characters."""
-        form_state = FormState()
-
         special_value = "Müller-Döring, Jr. (2024)"
         form_state.record_value("field", special_value)
 
         assert form_state.answers["field"] == special_value
 
-    def test_long_value(self):
+    def test_long_value(self, form_state):
         """Can record long values."""
-        form_state = FormState()
+        form_state.record_value("field", _LONG_VALUE)
 
-        long_value = "A" * 10000
-        form_state.record_value("field", long_value)
-
-        assert form_state.answers["field"] == long_value
+        # Stored as-is, without copying
+        assert form_state.answers["field"] is _LONG_VALUE
 
 
 class TestErrorHandling:
     """Test error handling workflow."""
 
-    def test_set_and_clear_error_via_record_value(self):
+    def test_set_and_clear_error_via_record_value(self, form_state):
         """Recording a value clears the error."""
-        form_state = FormState()
         field_id = "test_field"
 
         # Set error
@@ -311,10 +270,8 @@ class TestErrorHandling:
         form_state.record_value(field_id, "Valid")
         assert field_id not in form_state.validation_errors
 
-    def test_multiple_errors_independent(self):
+    def test_multiple_errors_independent(self, form_state):
         """Errors for different fields are independent."""
-        form_state = FormState()
-
         form_state.set_error("field1", "Error 1")
         form_state.set_error("field2", "Error 2")
 
@@ -324,10 +281,8 @@ class TestErrorHandling:
         assert "field1" not in form_state.validation_errors
         assert "field2" in form_state.validation_errors
 
-    def test_error_message_preserved(self):
+    def test_error_message_preserved(self, form_state):
         """Error message is preserved correctly."""
-        form_state = FormState()
-
         error_msg = "This is a detailed error message"
         form_state.set_error("field", error_msg)
 
@@ -337,27 +292,26 @@ class TestErrorHandling:
 class TestFormCompletion:
     """Test complete form workflows."""
 
-    def test_full_form_progression(self):
+    def test_full_form_progression(self, form_state):
         """Progressing through entire form."""
-        form_state = FormState()
+        fields = form_state.fields
 
-        initial_count = len(form_state.fields)
-
-        # Collect answers for all fields
-        for i, field in enumerate(form_state.fields):
-            assert form_state.current_field() == field
+        # Collect answers for all fields, remembering which field was current
+        visited = []
+        for i, field in enumerate(fields):
+            visited.append(form_state.current_field())
             form_state.record_value(field.field_id, f"Answer {i}")
             form_state.advance()
 
+        assert visited == list(fields)
+        assert form_state.answers == {f.field_id: f"Answer {i}" for i, f in enumerate(fields)}
+
         # Should be complete now
         assert form_state.is_complete()
-        assert len(form_state.answers) == initial_count
         assert form_state.progress_percent() == 100.0
 
-    def test_form_with_errors(self):
+    def test_form_with_errors(self, form_state):
         """Form progression with error handling."""
-        form_state = FormState()
-
         field = form_state.current_field()
 
         # First attempt with error
@@ -375,18 +329,14 @@ class TestFormCompletion:
 class TestFieldAccess:
     """Test field access patterns."""
 
-    def test_all_fields_accessible(self):
+    def test_all_fields_accessible(self, form_state):
         """All form fields are accessible."""
-        form_state = FormState()
-
         assert len(form_state.fields) == len(ANMELDUNG_FORM_FIELDS)
         for i, expected_field in enumerate(ANMELDUNG_FORM_FIELDS):
             assert form_state.fields[i] == expected_field
 
-    def test_field_properties_preserved(self):
+    def test_field_properties_preserved(self, form_state):
         """Field properties are preserved in state."""
-        form_state = FormState()
-
         for state_field in form_state.fields:
             # Field should have basic properties
             assert hasattr(state_field, "field_id")
@@ -394,3 +344,29 @@ class TestFieldAccess:
             assert hasattr(state_field, "description")
             assert len(state_field.field_id) > 0
             assert len(state_field.label) > 0
+
+
+class TestCopyAndPickle:
+    """FormState must survive deepcopy and pickle round trips."""
+
+    @pytest.mark.parametrize(
+        "clone",
+        [
+            pytest.param(copy.deepcopy, id="deepcopy"),
+            pytest.param(lambda state: pickle.loads(pickle.dumps(state)), id="pickle"),
+        ],
+    )
+    def test_round_trip(self, form_state, clone):
+        """A cloned state keeps its answers, errors, position and fields."""
+        form_state.record_value("family_name_p1", "Mueller")
+        form_state.set_error("first_name_p1", "required")
+        form_state.advance()
+
+        cloned = clone(form_state)
+
+        assert cloned.answers == form_state.answers
+        assert cloned.answers is not form_state.answers
+        assert cloned.validation_errors == form_state.validation_errors
+        assert cloned.current_index == form_state.current_index
+        assert cloned.fields == form_state.fields
+        assert cloned.index_of("housing_type") == form_state.index_of("housing_type")
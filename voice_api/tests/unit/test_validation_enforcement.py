@@ -2,22 +2,16 @@
 
 import pytest
 from voice_api.app.state import FormState
-from voice_api.app.validation import validate_field
+from voice_api.app.validation import validate_all, validate_field
 from voice_api.core import FIELD_BY_ID
 
 
 class TestValidationEnforcement:
     """Test that validation is properly enforced everywhere."""
 
-    def test_save_enforces_validation_for_date_field(self):
+    def test_save_enforces_validation_for_date_field(self, state_at_field):
         """Verify save would reject invalid date through validation."""
-        form_state = FormState()
-        
-        # Advance to birth_date field
-        while form_state.current_field().field_id != "birth_date_p1":
-            current = form_state.current_field()
-            form_state.record_value(current.field_id, "test")
-            form_state.advance()
+        form_state = state_at_field("birth_date_p1")
         
         current_field = form_state.current_field()
         assert current_field.field_id == "birth_date_p1"
@@ -29,16 +23,11 @@ class TestValidationEnforcement:
         assert not is_valid
         # Handler would reject this save
 
-    def test_update_enforces_validation_for_date_field(self):
+    def test_update_enforces_validation_for_date_field(self, state_at_field):
         """Verify update would reject invalid date through validation."""
-        form_state = FormState()
+        form_state = state_at_field("birth_date_p1")
         
         # Save valid birth date
-        while form_state.current_field().field_id != "birth_date_p1":
-            current = form_state.current_field()
-            form_state.record_value(current.field_id, "test")
-            form_state.advance()
-        
         form_state.record_value("birth_date_p1", "03021999")
         form_state.advance()
         
@@ -142,24 +131,22 @@ class TestValidationEnforcement:
         assert form_state.answers["birth_date_p1"] == valid_value
         assert form_state.current_index == 3  # Index unchanged
 
-    def test_choice_field_validation(self):
-        """Test that choice fields properly validate integer ranges."""
-        gender_field = FIELD_BY_ID["gender_p1"]
-        
-        # Valid choices (0-3 for gender)
-        for i in range(4):
-            is_valid, _ = validate_field(gender_field, str(i))
-            assert is_valid
-        
-        # Invalid choices
-        is_valid, _ = validate_field(gender_field, "4")
-        assert not is_valid
-        
-        is_valid, _ = validate_field(gender_field, "Male")
-        assert not is_valid
-        
-        is_valid, _ = validate_field(gender_field, "Berlin")
-        assert not is_valid
+    @pytest.mark.parametrize(
+        "value,expected_valid",
+        [
+            pytest.param("0", True, id="0"),
+            pytest.param("1", True, id="1"),
+            pytest.param("2", True, id="2"),
+            pytest.param("3", True, id="3"),
+            pytest.param("4", False, id="out_of_range"),
+            pytest.param("Male", False, id="label_text"),
+            pytest.param("Berlin", False, id="unrelated_text"),
+        ],
+    )
+    def test_choice_field_validation(self, value, expected_valid):
+        """Test that choice fields properly validate integer ranges (0-3 for gender)."""
+        is_valid, _ = validate_field(FIELD_BY_ID["gender_p1"], value)
+        assert is_valid is expected_valid
 
     def test_postal_code_validation(self):
         """Test that postal code fields validate correctly."""
@@ -181,3 +168,43 @@ class TestValidationEnforcement:
         
         is_valid, _ = validate_field(postal_field, "Berlin")
         assert not is_valid
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("   ", id="spaces"),
+            pytest.param(" \t\n", id="mixed_whitespace"),
+        ],
+    )
+    def test_blank_value_rejected_for_required_field(self, value):
+        """Empty and whitespace-only values should fail the required check."""
+        field = FIELD_BY_ID["family_name_p1"]
+        is_valid, message = validate_field(field, value)
+        assert not is_valid
+        assert message == f"{field.label} is required."
+
+
+class TestValidateAll:
+    """Test whole-form validation."""
+
+    def test_complete_valid_form_has_no_errors(self):
+        """A fully and correctly filled form should produce no errors."""
+        form_state = FormState()
+        for field in form_state.fields:
+            form_state.record_value(field.field_id, field.examples[0])
+
+        assert validate_all(form_state.fields, form_state.answers) == {}
+
+    def test_reports_invalid_and_missing_fields(self):
+        """Invalid answers and missing required answers should both be reported."""
+        form_state = FormState()
+        form_state.record_value("family_name_p1", "Mueller")
+        form_state.record_value("birth_date_p1", "Berlin")
+
+        errors = validate_all(form_state.fields, form_state.answers)
+
+        assert "family_name_p1" not in errors
+        assert "birth_date_p1" in errors
+        assert "first_name_p1" in errors
+